@@ -0,0 +1,96 @@
+"""
+Benchmark do fator de atrito vetorizado (`mecatutor.atrito`).
+
+Sorteia N pares (Re, ε/D) cobrindo o diagrama de Moody (Re de 10³ a 10⁸,
+ε/D de 0 a 0,05) e compara:
+
+    escalar      laço Python com `math`, Haaland + Newton até a tolerância
+    ponto fixo   iteração de ponto fixo de Colebrook usada antes nos solucionadores
+    vetorizado   `atrito.fator_atrito` (Haaland / Swamee-Jain + Newton)
+
+Para cada um mostra o tempo por ponto e o maior resíduo relativo de
+Colebrook nos pontos turbulentos.
+
+    python benchmarks/bench_atrito.py [--pontos N] [--escalar N]
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mecatutor import atrito  # noqa: E402
+
+
+def fator_escalar(reynolds, rugosidade_relativa, tolerancia=atrito.TOLERANCIA):
+    if reynolds < atrito.RE_LAMINAR:
+        return 64 / reynolds
+    x = -1.8 * math.log10((rugosidade_relativa / 3.7) ** 1.11 + 6.9 / reynolds)
+    for _ in range(atrito.MAX_ITERACOES):
+        argumento = rugosidade_relativa / 3.7 + 2.51 * x / reynolds
+        correcao = (x + 2 * math.log10(argumento)) / (1 + 2 / math.log(10) * 2.51 / reynolds / argumento)
+        x -= correcao
+        if abs(correcao) <= tolerancia * x:
+            break
+    return x ** -2
+
+
+def ponto_fixo(reynolds, rugosidade_relativa, iteracoes=20):
+    inverso = -1.8 * np.log10((rugosidade_relativa / 3.7) ** 1.11 + 6.9 / reynolds)
+    for _ in range(iteracoes):
+        inverso = -2.0 * np.log10(rugosidade_relativa / 3.7 + 2.51 * inverso / reynolds)
+    return np.where(reynolds < atrito.RE_LAMINAR, 64 / reynolds, 1 / inverso ** 2)
+
+
+def residuo_maximo(f, reynolds, rugosidade_relativa):
+    turbulento = reynolds >= atrito.RE_LAMINAR
+    x = f[turbulento] ** -0.5
+    direita = -2 * np.log10(rugosidade_relativa[turbulento] / 3.7 + 2.51 * x / reynolds[turbulento])
+    return float(np.max(np.abs(x - direita) / x))
+
+
+def cronometrar(funcao, repeticoes=5):
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pontos", type=int, default=1_000_000)
+    parser.add_argument("--escalar", type=int, default=50_000, help="pontos no laço escalar")
+    argumentos = parser.parse_args(argv)
+
+    gerador = np.random.default_rng(0)
+    reynolds = 10 ** gerador.uniform(3, 8, argumentos.pontos)
+    rugosidade_relativa = np.where(gerador.random(argumentos.pontos) < 0.1, 0.0, 10 ** gerador.uniform(-6, np.log10(0.05), argumentos.pontos))
+
+    n = argumentos.escalar
+    tempo, lista = cronometrar(lambda: [fator_escalar(r, e) for r, e in zip(reynolds[:n].tolist(), rugosidade_relativa[:n].tolist())], 1)
+    linhas = [("escalar", tempo / n, residuo_maximo(np.array(lista), reynolds[:n], rugosidade_relativa[:n]))]
+    tempo, f = cronometrar(lambda: ponto_fixo(reynolds, rugosidade_relativa))
+    linhas.append(("ponto fixo (20 it.)", tempo / argumentos.pontos, residuo_maximo(f, reynolds, rugosidade_relativa)))
+    for estimativa in atrito.ESTIMATIVAS:
+        tempo, f = cronometrar(lambda: atrito.fator_atrito(reynolds, rugosidade_relativa, estimativa=estimativa))
+        linhas.append((f"vetorizado ({estimativa})", tempo / argumentos.pontos, residuo_maximo(f, reynolds, rugosidade_relativa)))
+        _, passos = atrito.colebrook(reynolds, rugosidade_relativa, estimativa=estimativa)
+        linhas[-1] += (passos,)
+
+    escalar = linhas[0][1]
+    print(f"{argumentos.pontos} pontos (laço escalar com {n})")
+    print(f"{'método':<26}{'ns/ponto':>10}{'aceleração':>12}{'resíduo máx.':>14}{'passos':>8}")
+    for nome, por_ponto, residuo, *passos in linhas:
+        print(f"{nome:<26}{por_ponto * 1e9:>10.1f}{escalar / por_ponto:>11.0f}x{residuo:>14.1e}{(passos or [''])[0]:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Benchmark da pré-renderização de LaTeX nas resoluções mais longas.
+
+Compara, para cada documento, o Markdown original (tipografado pelo KaTeX no
+navegador) com a versão pré-renderizada em MathML: blocos que deixam de ser
+tipografados no cliente, tamanho do payload e custo no servidor com cache
+frio, cache em disco e cache em memória.
+
+    python benchmarks/bench_latex.py [id_questao ...]
+
+A troca tem um custo: o MathML é mais verboso que o LaTeX, então o payload
+de cada resolução cresce (2.18 passa de 2,0 KB para 5,3 KB, 2,7×) em troca
+de o navegador não tipografar os blocos. Este script mede só o lado do
+servidor, o tamanho do payload e os blocos removidos do cliente; o tempo até
+a primeira pintura no celular NÃO é medido aqui (exige um navegador) e deve
+ser confirmado no DevTools (Performance), com rede limitada, nos dois modos
+antes de concluir que a pré-renderização compensa.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mecatutor import latex  # noqa: E402
+from mecatutor.conteudo import Conteudo  # noqa: E402
+
+REPETICOES = 200
+
+
+def cronometrar(funcao, repeticoes=1):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1000
+
+
+def main(ids):
+    if not latex.disponivel():
+        print("latex2mathml não está instalado.")
+        return 1
+    banco = Conteudo.abrir().banco()
+    ids = ids or sorted(banco, key=lambda qid: len(banco[qid].resolucao), reverse=True)[:2]
+    print(f"{'questão':>8} {'blocos':>7} {'KB orig.':>9} {'KB pré':>8} {'payload':>8} {'frio ms':>8} {'disco ms':>9} "
+          f"{'memória µs':>11}")
+    for qid in ids:
+        texto = banco[qid].resolucao
+        blocos = len(latex.BLOCO_MATEMATICO.findall(texto))
+        with tempfile.TemporaryDirectory() as pasta:
+            frio = cronometrar(lambda: latex.CacheLatex(Path(pasta)).renderizar(texto))
+            disco = cronometrar(lambda: latex.CacheLatex(Path(pasta)).renderizar(texto), REPETICOES)
+            cache = latex.CacheLatex(Path(pasta))
+            renderizado = cache.renderizar(texto)
+            memoria = cronometrar(lambda: cache.renderizar(texto), REPETICOES) * 1000
+        original, pre = len(texto.encode()), len(renderizado.encode())
+        print(f"{qid:>8} {blocos:>7} {original / 1024:>9.1f} {pre / 1024:>8.1f} {pre / original:>7.1f}x "
+              f"{frio:>8.2f} {disco:>9.3f} {memoria:>11.1f}")
+    print("\nPrimeira pintura no cliente não medida: confirme no DevTools com os dois modos.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
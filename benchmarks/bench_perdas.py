@@ -0,0 +1,79 @@
+"""
+Benchmark da perda de carga de sistemas (`mecatutor.perdas_localizadas`).
+
+Monta sistemas com N trechos sorteados (comprimento, diâmetro e de 0 a 4
+componentes da Tabela 8.2 por trecho) e compara, para uma curva do
+sistema com M vazões:
+
+    laço         `tubulacoes.perda_carga` trecho a trecho e vazão a vazão
+    compilado    `Sistema.compilar` uma vez e `perda_carga` sobre as M vazões
+
+O laço usa o mesmo ΣK por trecho (`CatalogoAcessorios.soma_k`), então
+os dois totais devem coincidir.
+
+    python benchmarks/bench_perdas.py [--trechos 10 100 1000 5000] [--vazoes 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mecatutor import tubulacoes  # noqa: E402
+from mecatutor.perdas_localizadas import TABELA_ACESSORIOS, CatalogoAcessorios, Sistema  # noqa: E402
+from mecatutor.tabelas import TABELAS  # noqa: E402
+
+
+def sistema_aleatorio(catalogo, trechos, semente=0):
+    gerador = np.random.default_rng(semente)
+    sistema = Sistema(catalogo)
+    descricao = []
+    for _ in range(trechos):
+        comprimento = float(gerador.uniform(1, 50))
+        diametro = float(gerador.choice([0.05, 0.075, 0.1, 0.15]))
+        acessorios = [catalogo.componentes[i] for i in gerador.integers(0, len(catalogo.componentes), gerador.integers(0, 5))]
+        sistema.trecho(comprimento, diametro, rugosidade=4.5e-5, acessorios=acessorios)
+        descricao.append((comprimento, diametro, catalogo.soma_k(acessorios)))
+    return sistema, descricao
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trechos", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--vazoes", type=int, default=50)
+    argumentos = parser.parse_args(argv)
+
+    catalogo = CatalogoAcessorios.de_dicionario(TABELA_ACESSORIOS, TABELAS[TABELA_ACESSORIOS])
+    vazoes = np.linspace(0.001, 0.02, argumentos.vazoes)
+    print(f"{argumentos.vazoes} vazões por curva")
+    print(f"{'trechos':>8}{'laço ms':>10}{'compilar ms':>13}{'curva ms':>10}{'reavaliar ms':>14}{'diferença':>11}")
+    for trechos in argumentos.trechos:
+        sistema, descricao = sistema_aleatorio(catalogo, trechos)
+
+        inicio = time.perf_counter()
+        laco = [sum(float(tubulacoes._perda_carga(q, d, l, 4.5e-5, tubulacoes.NU_AGUA, k)) for l, d, k in descricao)
+                for q in vazoes.tolist()]
+        tempo_laco = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        sistema.compilar()
+        compilar = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        curva = sistema.perda_carga(vazoes)
+        primeira = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        sistema.perda_carga(vazoes * 1.01)
+        reavaliar = time.perf_counter() - inicio
+
+        diferenca = float(np.max(np.abs(curva - laco) / np.abs(laco)))
+        print(f"{trechos:>8}{tempo_laco * 1e3:>10.1f}{compilar * 1e3:>13.2f}{primeira * 1e3:>10.2f}"
+              f"{reavaliar * 1e3:>14.2f}{diferenca:>11.1e}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
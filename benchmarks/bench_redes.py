@@ -0,0 +1,65 @@
+"""
+Benchmark do solucionador de redes (`mecatutor.redes`).
+
+Monta malhas quadradas de n × n nós (2n(n - 1) trechos, com laços),
+alimentadas por um reservatório num canto e com consumo em todos os
+outros nós, e mostra para cada tamanho as iterações de Newton, o tempo
+total e o tempo por trecho e por iteração, que deve ficar
+aproximadamente constante (custo linear no número de trechos).
+
+    python benchmarks/bench_redes.py [--lados 10 20 40 80 120]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mecatutor.redes import Rede  # noqa: E402
+
+
+def malha(lado: int, semente: int = 0) -> Rede:
+    gerador = np.random.default_rng(semente)
+    rede = Rede()
+    rede.reservatorio("0_0", carga=100.0)
+    for i in range(lado):
+        for j in range(lado):
+            if i or j:
+                rede.no(f"{i}_{j}", demanda=1e-4)
+    for i in range(lado):
+        for j in range(lado):
+            for vizinho in ((i + 1, j), (i, j + 1)):
+                if max(vizinho) < lado:
+                    rede.tubo(
+                        f"{i}_{j}-{vizinho[0]}_{vizinho[1]}", f"{i}_{j}", f"{vizinho[0]}_{vizinho[1]}",
+                        comprimento=float(gerador.uniform(50, 150)), diametro=float(gerador.choice([0.1, 0.15, 0.2])),
+                        rugosidade=4.5e-5,
+                    )
+    return rede
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lados", type=int, nargs="+", default=[10, 20, 40, 80, 120])
+    argumentos = parser.parse_args(argv)
+
+    print(f"{'trechos':>8}{'iterações':>11}{'compilar ms':>13}{'resolver ms':>13}{'µs/trecho/it.':>15}{'resíduo Q':>11}")
+    for lado in argumentos.lados:
+        rede = malha(lado)
+        inicio = time.perf_counter()
+        compilada = rede.compilar()
+        compilar = time.perf_counter() - inicio
+        resultado = rede.resolver()
+        trechos = len(compilada.trechos)
+        por_trecho = resultado.tempo_total / trechos / max(resultado.iteracoes, 1)
+        print(f"{trechos:>8}{resultado.iteracoes:>11}{compilar * 1e3:>13.1f}{resultado.tempo_total * 1e3:>13.1f}"
+              f"{por_trecho * 1e6:>15.2f}{resultado.residuo_continuidade:>11.1e}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Benchmark de latência de rerun do app, executado sem navegador pelo AppTest.
+
+Cenários (gerados a partir dos próprios widgets, então crescem com o conteúdo):
+
+    menu/<página>          troca de página no menu lateral
+    resumo/<capítulo>      escolha de capítulo em "Resumos dos Capítulos"
+    questao/<id>           escolha de questão em "Exercícios Resolvidos"
+    resposta/<id>          resposta digitada na primeira caixa da questão
+
+Para cada cenário o estado é preparado sem medição e só o rerun final é
+cronometrado (mediana de --repeticoes execuções). O pico de memória vem de uma
+execução separada com tracemalloc, para não distorcer o tempo. O número de
+elementos é o total renderizado na página.
+
+    python benchmarks/bench_reruns.py --salvar     # grava a linha de base
+    python benchmarks/bench_reruns.py              # compara com a linha de base
+
+Sai com código 1 se o número de elementos de algum cenário mudar em relação
+à linha de base (a página renderizou outra coisa) ou se um cenário da linha
+de base não existir mais. Tempo acima de `--limite` vezes a linha de base só
+gera aviso: o tempo depende da máquina e da carga dela, então gere a linha
+de base no mesmo tipo de máquina em que o benchmark roda antes do deploy e
+regrave-a (--salvar) sempre que o app mudar.
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+import warnings
+
+from streamlit.testing.v1 import AppTest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RAIZ, "app.py")
+LINHA_DE_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_reruns.json")
+
+
+def novo_app():
+    return AppTest.from_file(APP, default_timeout=60).run()
+
+
+def contar_elementos(at):
+    return sum(1 for _ in at.main) + sum(1 for _ in at.sidebar)
+
+
+def cenarios():
+    """
+    Lista de (nome, preparar) onde `preparar(at)` leva o app ao estado
+    anterior ao cenário (com reruns não medidos, se preciso) e ajusta o
+    widget da interação; o rerun seguinte é o que se mede.
+    """
+    at = novo_app()
+    lista = []
+
+    for pagina in at.sidebar.radio[0].options:
+        lista.append((f"menu/{pagina}", lambda at, p=pagina: at.sidebar.radio[0].set_value(p)))
+
+    for capitulo in at.selectbox[0].options:
+        lista.append((f"resumo/{capitulo}", lambda at, c=capitulo: at.selectbox[0].set_value(c)))
+
+    at.sidebar.radio[0].set_value("Exercícios Resolvidos").run()
+    for capitulo in at.selectbox(key="capitulo_escolhido").options:
+        at.selectbox(key="capitulo_escolhido").set_value(int(capitulo)).run()
+        for questao in at.selectbox(key="questao_id").options:
+            def abrir(at, c=int(capitulo), q=questao):
+                at.sidebar.radio[0].set_value("Exercícios Resolvidos").run()
+                at.selectbox(key="capitulo_escolhido").set_value(c).run()
+                at.selectbox(key="questao_id").set_value(q)
+
+            def responder(at, abrir=abrir):
+                abrir(at)
+                at.run()
+                at.text_input[0].input("1,0")
+
+            lista.append((f"questao/{questao}", abrir))
+            lista.append((f"resposta/{questao}", responder))
+    return lista
+
+
+def medir(preparar, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        at = novo_app()
+        preparar(at)
+        inicio = time.perf_counter()
+        at.run()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+
+    at = novo_app()
+    preparar(at)
+    tracemalloc.start()
+    at.run()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "tempo_ms": round(statistics.median(tempos), 2),
+        "memoria_pico_kb": round(pico / 1024, 1),
+        "elementos": contar_elementos(at),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de rerun do app via AppTest.")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--limite", type=float, default=1.25,
+                        help="razão tempo/linha de base acima da qual o cenário gera aviso")
+    parser.add_argument("--saida", default=LINHA_DE_BASE)
+    parser.add_argument("--salvar", action="store_true", help="grava os resultados como nova linha de base")
+    parser.add_argument("--filtro", default="", help="mede só cenários cujo nome contém este texto")
+    argumentos = parser.parse_args(argv)
+    warnings.filterwarnings("ignore")
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    resultados = {}
+    for nome, preparar in cenarios():
+        if argumentos.filtro in nome:
+            resultados[nome] = medir(preparar, argumentos.repeticoes)
+
+    if argumentos.salvar:
+        with open(argumentos.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(resultados, arquivo, ensure_ascii=False, indent=2)
+            arquivo.write("\n")
+        print(f"{len(resultados)} cenários gravados em {argumentos.saida}")
+        return 0
+
+    base = {}
+    if os.path.exists(argumentos.saida):
+        with open(argumentos.saida, encoding="utf-8") as arquivo:
+            base = json.load(arquivo)
+
+    lentos, divergentes = [], []
+    print(f"{'cenário':<58}{'ms':>9}{'base':>9}{'razão':>8}{'pico KB':>10}{'elem.':>7}{'base':>6}")
+    for nome, atual in resultados.items():
+        anterior = base.get(nome)
+        razao = atual["tempo_ms"] / anterior["tempo_ms"] if anterior else float("nan")
+        marca = ""
+        if anterior and atual["elementos"] != anterior["elementos"]:
+            divergentes.append(nome)
+            marca = "  <-- elementos"
+        elif anterior and razao > argumentos.limite:
+            lentos.append(nome)
+            marca = "  (lento)"
+        print(f"{nome:<58}{atual['tempo_ms']:>9.1f}{anterior['tempo_ms'] if anterior else float('nan'):>9.1f}"
+              f"{razao:>8.2f}{atual['memoria_pico_kb']:>10.0f}{atual['elementos']:>7}"
+              f"{anterior['elementos'] if anterior else '-':>6}{marca}")
+    ausentes = [nome for nome in base if argumentos.filtro in nome and nome not in resultados]
+
+    if lentos:
+        print(f"\nAviso: {len(lentos)} cenário(s) acima de {argumentos.limite:.2f}x o tempo da linha de base.")
+    if ausentes:
+        print(f"\n{len(ausentes)} cenário(s) da linha de base não existem mais: {', '.join(ausentes)}")
+    if divergentes:
+        print(f"\n{len(divergentes)} cenário(s) com número de elementos diferente da linha de base.")
+    return 1 if divergentes or ausentes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
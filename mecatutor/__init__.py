@@ -0,0 +1,3 @@
+"""
+MecaTutorIA: conteúdo e lógica de apoio ao app Streamlit (app.py).
+"""
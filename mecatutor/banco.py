@@ -0,0 +1,143 @@
+"""
+Banco de questões tipado e somente leitura.
+
+O banco é montado uma única vez por processo (ver `carregar_conteudo` em
+app.py) e compartilhado entre todas as sessões, por isso nada aqui deve ser
+mutado depois da construção.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Iterator, Mapping, Union
+
+Valor = Union[float, str]
+
+
+@dataclass(frozen=True)
+class Questao:
+    """
+    Uma questão do banco, com resposta única ou dividida em subitens.
+    """
+    id: str
+    capitulo: int
+    enunciado: str
+    dica: str
+    resolucao: str
+    resposta: Union[Valor, Mapping[str, Valor]]
+    tolerancia: Union[float, Mapping[str, float]]
+    unidade: Union[str, Mapping[str, str]]
+    tipo: str = "numero"
+    imagem: str | None = None
+    # Valores errados previsíveis: [(valor, explicação)], por subitem se houver
+    erros_comuns: Union[tuple, Mapping[str, tuple]] = ()
+
+    @classmethod
+    def de_dicionario(cls, id: str, dados: Mapping) -> "Questao":
+        """
+        Converte uma entrada de `QUESTOES` em `Questao`.
+        """
+        def congelar(valor):
+            return MappingProxyType(dict(valor)) if isinstance(valor, Mapping) else valor
+
+        def pares(lista):
+            return tuple((float(valor), explicacao) for valor, explicacao in lista)
+
+        erros_comuns = dados.get("erros_comuns", ())
+        if isinstance(erros_comuns, Mapping):
+            erros_comuns = MappingProxyType({subitem: pares(lista) for subitem, lista in erros_comuns.items()})
+        else:
+            erros_comuns = pares(erros_comuns)
+
+        return cls(
+            id=id,
+            capitulo=int(dados["capitulo"]),
+            enunciado=dados["enunciado"],
+            dica=dados["dica"],
+            resolucao=dados["resolucao"],
+            resposta=congelar(dados["resposta"]),
+            tolerancia=congelar(dados["tolerancia"]),
+            unidade=congelar(dados["unidade"]),
+            tipo=dados.get("tipo", "numero"),
+            imagem=dados.get("imagem") or None,
+            erros_comuns=erros_comuns,
+        )
+
+    @property
+    def tem_subitens(self) -> bool:
+        return isinstance(self.resposta, Mapping)
+
+    @property
+    def subitens(self) -> tuple[str, ...]:
+        """
+        Nomes dos subitens, na ordem do enunciado; vazio para resposta única.
+        """
+        return tuple(self.resposta) if isinstance(self.resposta, Mapping) else ()
+
+    def resposta_de(self, subitem: str | None = None) -> Valor:
+        return self.resposta[subitem] if subitem is not None else self.resposta  # type: ignore[index]
+
+    def tolerancia_de(self, subitem: str | None = None) -> float:
+        if isinstance(self.tolerancia, Mapping):
+            return self.tolerancia[subitem]
+        return self.tolerancia
+
+    def unidade_de(self, subitem: str | None = None) -> str:
+        if isinstance(self.unidade, Mapping):
+            return self.unidade[subitem]
+        return self.unidade
+
+    def erros_comuns_de(self, subitem: str | None = None) -> tuple[tuple[float, str], ...]:
+        if isinstance(self.erros_comuns, Mapping):
+            return self.erros_comuns.get(subitem, ())
+        return self.erros_comuns
+
+
+class BancoQuestoes:
+    """
+    Coleção somente leitura de questões indexada pelo número da questão.
+
+    Só o índice (questão -> capítulo) é carregado na construção; cada questão
+    é decodificada por `carregar` no primeiro acesso e mantida em memória.
+    """
+
+    def __init__(self, capitulos: Mapping[str, int], carregar: Callable[[str], Mapping]):
+        self._capitulos = MappingProxyType(dict(capitulos))
+        self._carregar = carregar
+        self._questoes: dict[str, Questao] = {}
+
+    @classmethod
+    def de_dicionario(cls, dados: Mapping[str, Mapping]) -> "BancoQuestoes":
+        return cls({qid: q["capitulo"] for qid, q in dados.items()}, dados.__getitem__)
+
+    def __getitem__(self, questao_id: str) -> Questao:
+        questao = self._questoes.get(questao_id)
+        if questao is None:
+            if questao_id not in self._capitulos:
+                raise KeyError(questao_id)
+            questao = Questao.de_dicionario(questao_id, self._carregar(questao_id))
+            # setdefault é atômico: sessões concorrentes ficam com a mesma instância
+            questao = self._questoes.setdefault(questao_id, questao)
+        return questao
+
+    def __contains__(self, questao_id: object) -> bool:
+        return questao_id in self._capitulos
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._capitulos)
+
+    def __len__(self) -> int:
+        return len(self._capitulos)
+
+    def get(self, questao_id: str, padrao: Questao | None = None) -> Questao | None:
+        return self[questao_id] if questao_id in self._capitulos else padrao
+
+    def capitulo_de(self, questao_id: str) -> int:
+        return self._capitulos[questao_id]
+
+    def ids(self) -> tuple[str, ...]:
+        return tuple(self._capitulos)
+
+    def questoes(self) -> tuple[Questao, ...]:
+        return tuple(self[qid] for qid in self._capitulos)
@@ -0,0 +1,115 @@
+"""
+Acesso unificado ao conteúdo do app, vindo das fontes ou do pacote binário.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Callable
+
+from mecatutor import fontes
+from mecatutor.banco import BancoQuestoes
+from mecatutor.indice import IndiceNavegacao
+from mecatutor.registro import RegistroResumos
+
+
+class Conteudo:
+    """
+    Fachada sobre uma função `ler(chave)` (ver `mecatutor.fontes`).
+    """
+
+    def __init__(self, ler: Callable[[str], Any], origem: str):
+        self._ler = ler
+        self.origem = origem
+        self._banco: BancoQuestoes | None = None
+        self._indice: IndiceNavegacao | None = None
+        self._resumos: RegistroResumos | None = None
+        self._imagens: dict[str, dict] | None = None
+        self._propriedades = None
+        self._acessorios = None
+        self._erros_comuns = None
+        self._variantes = None
+
+    @classmethod
+    def abrir(cls, caminho_pacote: str | None = None) -> "Conteudo":
+        """
+        Usa o pacote em `caminho_pacote` se ele existir; caso contrário, lê
+        das fontes.
+        """
+        if caminho_pacote and os.path.exists(caminho_pacote):
+            from mecatutor.pacote import Pacote
+            pacote = Pacote(caminho_pacote)
+            return cls(pacote.ler, origem=f"pacote {pacote.versao}")
+        return cls(fontes.ler, origem="fontes")
+
+    def banco(self) -> BancoQuestoes:
+        if self._banco is None:
+            indice = self._ler("questoes/indice")
+            self._banco = BancoQuestoes(indice, lambda qid: self._ler(f"questao/{qid}"))
+        return self._banco
+
+    def indice(self) -> IndiceNavegacao:
+        if self._indice is None:
+            self._indice = IndiceNavegacao(self._ler("questoes/indice"))
+        return self._indice
+
+    def resumos(self) -> RegistroResumos:
+        if self._resumos is None:
+            self._resumos = RegistroResumos(self._ler)
+        return self._resumos
+
+    def tabela(self, tabela_id: str) -> dict:
+        return self._ler(f"tabela/{tabela_id}")
+
+    def propriedades(self):
+        """
+        Armazém colunar das tabelas de propriedades (`ArmazemPropriedades`).
+        """
+        if self._propriedades is None:
+            from mecatutor.propriedades import ArmazemPropriedades
+            self._propriedades = ArmazemPropriedades.de_conteudo(self.tabela)
+        return self._propriedades
+
+    def acessorios(self):
+        """
+        Catálogo de coeficientes de perda localizada (`CatalogoAcessorios`).
+        """
+        if self._acessorios is None:
+            from mecatutor.perdas_localizadas import TABELA_ACESSORIOS, CatalogoAcessorios
+            self._acessorios = CatalogoAcessorios.de_dicionario(TABELA_ACESSORIOS, self.tabela(TABELA_ACESSORIOS))
+        return self._acessorios
+
+    def tabela_resumo(self, tabela_id: str):
+        """
+        Tabela de um bloco `<!-- tabela:... -->` dos resumos (com `titulo` e `dataframe`).
+        """
+        from mecatutor.perdas_localizadas import TABELA_ACESSORIOS
+        if tabela_id == TABELA_ACESSORIOS:
+            return self.acessorios()
+        return self.propriedades().tabela(tabela_id)
+
+    def erros_comuns(self):
+        """
+        Catálogo de erros comuns por questão (`CatalogoErros`).
+        """
+        if self._erros_comuns is None:
+            from mecatutor.erros_comuns import CatalogoErros
+            self._erros_comuns = CatalogoErros()
+        return self._erros_comuns
+
+    def variantes(self):
+        """
+        Variantes parametrizadas das questões (`CatalogoVariantes`).
+        """
+        if self._variantes is None:
+            from mecatutor.variantes import CatalogoVariantes
+            self._variantes = CatalogoVariantes(self.banco())
+        return self._variantes
+
+    def imagens(self) -> dict[str, dict]:
+        """
+        Manifesto das figuras: caminho relativo -> {"bytes", "sha256"}.
+        """
+        if self._imagens is None:
+            self._imagens = self._ler("imagens")
+        return self._imagens
@@ -0,0 +1,116 @@
+"""
+Correção das respostas, sem dependência do Streamlit.
+
+`corrigir` avalia uma resposta digitada; `corrigir_lote` avalia de uma vez
+todas as respostas de uma turma para a mesma questão/subitem, comparando com
+NumPy. A interface e as ferramentas offline usam as mesmas regras.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Sequence
+
+from mecatutor.banco import Questao, Valor
+from mecatutor.unidades import ler_resposta
+
+if TYPE_CHECKING:
+    from mecatutor.erros_comuns import CatalogoErros
+
+# Códigos dos vereditos (também usados nos arrays de `corrigir_lote`)
+INVALIDA = -1
+INCORRETA = 0
+CORRETA = 1
+
+
+@dataclass(frozen=True)
+class Veredito:
+    codigo: int
+    valor: float | str | None
+    esperado: Valor
+    unidade: str
+    # Explicação do erro comum reconhecido, se a resposta estiver incorreta
+    explicacao: str | None = None
+
+    @property
+    def correta(self) -> bool:
+        return self.codigo == CORRETA
+
+    @property
+    def invalida(self) -> bool:
+        return self.codigo == INVALIDA
+
+
+def normalizar_texto(texto: str) -> str:
+    return texto.strip().replace(" ", "")
+
+
+def corrigir(
+    questao: Questao, valor_bruto: str, subitem: str | None = None, erros: "CatalogoErros | None" = None
+) -> Veredito:
+    """
+    Corrige uma resposta de `questao` (ou do `subitem` dela). Com `erros`,
+    respostas incorretas numéricas recebem a explicação do erro comum
+    correspondente, se houver.
+    """
+    esperado = questao.resposta_de(subitem)
+    unidade = questao.unidade_de(subitem)
+
+    if questao.tipo == "texto":
+        valor = normalizar_texto(valor_bruto)
+        codigo = CORRETA if valor == normalizar_texto(str(esperado)) else INCORRETA
+        return Veredito(codigo, valor, esperado, unidade)
+
+    try:
+        valor = ler_resposta(valor_bruto, unidade)
+    except ValueError:
+        return Veredito(INVALIDA, None, esperado, unidade)
+    if not math.isfinite(valor):
+        return Veredito(INVALIDA, None, esperado, unidade)
+    if abs(valor - esperado) <= questao.tolerancia_de(subitem):
+        return Veredito(CORRETA, valor, esperado, unidade)
+    explicacao = erros.explicar(questao, subitem, valor) if erros is not None else None
+    return Veredito(INCORRETA, valor, esperado, unidade, explicacao)
+
+
+def corrigir_lote(questao: Questao, valores: Sequence, subitem: str | None = None):
+    """
+    Corrige várias respostas para a mesma questão/subitem.
+
+    `valores` pode conter textos digitados (com ou sem unidade) ou números
+    já na unidade da questão (NaN e infinito contam como inválidos). Retorna um array
+    int8 com CORRETA, INCORRETA ou INVALIDA na mesma ordem.
+    """
+    import numpy as np
+
+    esperado = questao.resposta_de(subitem)
+    if questao.tipo == "texto":
+        alvo = normalizar_texto(str(esperado))
+        return np.fromiter(
+            (CORRETA if normalizar_texto(str(v)) == alvo else INCORRETA for v in valores),
+            dtype=np.int8, count=len(valores),
+        )
+
+    numeros = np.asarray(valores)
+    if numeros.dtype.kind not in "fiu":
+        unidade = questao.unidade_de(subitem)
+        numeros = np.fromiter((_numero_ou_nan(v, unidade) for v in valores), dtype=np.float64, count=len(valores))
+    else:
+        numeros = numeros.astype(np.float64, copy=False)
+
+    vereditos = np.where(
+        np.abs(numeros - esperado) <= questao.tolerancia_de(subitem), CORRETA, INCORRETA
+    ).astype(np.int8)
+    vereditos[~np.isfinite(numeros)] = INVALIDA
+    return vereditos
+
+
+def _numero_ou_nan(valor, unidade: str) -> float:
+    if isinstance(valor, (int, float)):
+        return float(valor)
+    try:
+        numero = ler_resposta(str(valor), unidade)
+    except ValueError:
+        return float("nan")
+    return numero if math.isfinite(numero) else float("nan")
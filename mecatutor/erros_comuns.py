@@ -0,0 +1,115 @@
+"""
+Erros comuns ("assinaturas de erro") para explicar respostas incorretas.
+
+Para cada questão/subitem numérico é montada, uma única vez, uma tabela com
+os valores errados previsíveis e suas explicações:
+
+    específicos   os `erros_comuns` cadastrados na questão
+    genéricos     derivados da resposta: fator 1000 (kPa/Pa, L/m³, mm/m),
+                  sinal trocado, 1 atm de diferença (absoluta x relativa) e,
+                  no capítulo 8, diâmetro trocado pelo raio
+
+Uma resposta errada é comparada com todas as assinaturas de uma vez, em
+uma única operação vetorizada.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from mecatutor.banco import Questao
+from mecatutor.unidades import UNIDADES, fator, unidade_principal
+
+# Margem mínima em torno de cada assinatura, relativa ao valor
+MARGEM_RELATIVA = 0.01
+# Margem máxima das assinaturas por fator (x1000, x2, ...), relativa ao valor:
+# a tolerância da questão entra só como erro relativo, limitado a este valor
+MARGEM_RELATIVA_FATOR = 0.05
+
+
+@dataclass(frozen=True)
+class TabelaErros:
+    valores: np.ndarray
+    tolerancias: np.ndarray
+    explicacoes: tuple[str, ...]
+
+    def identificar(self, valor: float) -> str | None:
+        """
+        Explicação da primeira assinatura que coincide com `valor`, se houver.
+        """
+        coincide = np.abs(self.valores - valor) <= self.tolerancias
+        indice = int(np.argmax(coincide))
+        return self.explicacoes[indice] if coincide[indice] else None
+
+
+def assinaturas(questao: Questao, subitem: str | None = None) -> list[tuple[float, float, str]]:
+    """
+    (valor, tolerância, explicação) de uma questão/subitem, específicas
+    primeiro. Assinaturas que se confundem com a resposta certa são omitidas.
+    """
+    esperado = float(questao.resposta_de(subitem))
+    tolerancia = float(questao.tolerancia_de(subitem))
+    grandeza = UNIDADES.get(unidade_principal(questao.unidade_de(subitem)), ("",))[0]
+
+    def por_fator(valor: float) -> tuple[float, float]:
+        # Banda relativa em torno do próprio valor: escalar a tolerância da
+        # questão (que pode ser larga) faria a banda engolir a resposta certa
+        relativa = min(tolerancia / abs(esperado), MARGEM_RELATIVA_FATOR)
+        return valor, relativa * abs(valor)
+
+    candidatas = [(valor, tolerancia, explicacao) for valor, explicacao in questao.erros_comuns_de(subitem)]
+    if esperado:
+        candidatas += [
+            (*por_fator(esperado * 1000),
+             "O valor está 1000 vezes maior que o esperado: confira a conversão de unidades (kPa/Pa, L/m³, mm/m)."),
+            (*por_fator(esperado / 1000),
+             "O valor está 1000 vezes menor que o esperado: confira a conversão de unidades (kPa/Pa, L/m³, mm/m)."),
+            (-esperado, tolerancia, "O módulo está correto, mas o sinal está trocado."),
+        ]
+    if grandeza == "pressao":
+        atm = fator("atm", questao.unidade_de(subitem))
+        explicacao = "A diferença é de 1 atm: confira se a resposta pede pressão absoluta ou relativa (manométrica)."
+        candidatas += [(esperado + atm, tolerancia, explicacao), (esperado - atm, tolerancia, explicacao)]
+    if esperado and questao.capitulo == 8:
+        if grandeza == "comprimento":
+            explicacao = "A diferença é de um fator 2: confira se o diâmetro não foi trocado pelo raio."
+            candidatas += [(*por_fator(esperado * 2), explicacao), (*por_fator(esperado / 2), explicacao)]
+        elif grandeza in ("vazao", "velocidade"):
+            explicacao = "A diferença é de um fator 4: confira a área A = πD²/4 (diâmetro trocado pelo raio)."
+            candidatas += [(*por_fator(esperado * 4), explicacao), (*por_fator(esperado / 4), explicacao)]
+
+    resultado = []
+    for valor, margem, explicacao in candidatas:
+        margem = max(margem, MARGEM_RELATIVA * abs(valor))
+        if abs(valor - esperado) > margem + tolerancia:
+            resultado.append((valor, margem, explicacao))
+    return resultado
+
+
+class CatalogoErros:
+    """
+    Tabelas de assinaturas, montadas no primeiro uso de cada
+    questão/subitem e compartilhadas entre as sessões.
+    """
+
+    def __init__(self):
+        # A resposta entra na chave: variantes da mesma questão têm tabelas próprias
+        self._tabelas: dict[tuple[str, str | None, object], TabelaErros | None] = {}
+
+    def tabela(self, questao: Questao, subitem: str | None = None) -> TabelaErros | None:
+        chave = (questao.id, subitem, questao.resposta_de(subitem))
+        if chave not in self._tabelas:
+            tabela = None
+            if questao.tipo != "texto":
+                lista = assinaturas(questao, subitem)
+                if lista:
+                    valores, tolerancias, explicacoes = zip(*lista)
+                    tabela = TabelaErros(np.array(valores), np.array(tolerancias), explicacoes)
+            self._tabelas.setdefault(chave, tabela)
+        return self._tabelas[chave]
+
+    def explicar(self, questao: Questao, subitem: str | None, valor: float) -> str | None:
+        tabela = self.tabela(questao, subitem)
+        return tabela.identificar(valor) if tabela is not None else None
@@ -0,0 +1,246 @@
+"""
+Estatísticas por questão/subitem mantidas incrementalmente a cada tentativa.
+
+Para cada (questão, subitem) guardamos só contadores de tamanho fixo:
+
+    tentativas, corretas, invalidas
+    histograma de tentativas até o primeiro acerto (1, 2, ..., MAX_TENTATIVAS+)
+    esboço Space-Saving com os valores errados mais frequentes (só da
+    questão do livro: cada variante tem outra resposta, e os valores
+    errados de parâmetros diferentes não se comparam)
+
+Atualizar custa O(1) por tentativa e ler o painel independe de quantas
+tentativas já houve. O estado é salvo periodicamente em JSON (troca
+atômica do arquivo) e recarregado na inicialização.
+
+Configurado por MECATUTOR_ESTATISTICAS (caminho do arquivo de checkpoint).
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from mecatutor.correcao import CORRETA, INVALIDA
+
+# Acertos depois de mais tentativas que isso caem no último bucket
+MAX_TENTATIVAS = 20
+# Contadores do esboço de valores errados por questão/subitem
+CAPACIDADE_ERROS = 16
+# Sessões acompanhadas ao mesmo tempo para contar tentativas até o acerto
+CAPACIDADE_SESSOES = 200_000
+INTERVALO_CHECKPOINT = 60.0
+
+_RESOLVIDA = 0
+
+
+class EsbocoFrequentes:
+    """
+    Space-Saving (Metwally et al.): `capacidade` contadores; todo valor com
+    frequência acima de total/capacidade está garantidamente presente.
+    """
+
+    __slots__ = ("capacidade", "contadores")
+
+    def __init__(self, capacidade: int = CAPACIDADE_ERROS):
+        self.capacidade = capacidade
+        self.contadores: dict[str, list[int]] = {}  # valor -> [contagem, erro máximo]
+
+    def observar(self, valor: str) -> None:
+        contador = self.contadores.get(valor)
+        if contador is not None:
+            contador[0] += 1
+        elif len(self.contadores) < self.capacidade:
+            self.contadores[valor] = [1, 0]
+        else:
+            menor = min(self.contadores, key=lambda chave: self.contadores[chave][0])
+            contagem = self.contadores.pop(menor)[0]
+            self.contadores[valor] = [contagem + 1, contagem]
+
+    def mais_frequentes(self, k: int) -> list[tuple[str, int]]:
+        ordenados = sorted(self.contadores.items(), key=lambda item: -item[1][0])
+        return [(valor, contagem) for valor, (contagem, _) in ordenados[:k]]
+
+
+class EstatisticaItem:
+    __slots__ = ("tentativas", "corretas", "invalidas", "ate_acertar", "erros")
+
+    def __init__(self):
+        self.tentativas = 0
+        self.corretas = 0
+        self.invalidas = 0
+        self.ate_acertar = [0] * (MAX_TENTATIVAS + 1)  # índice 0 não usado
+        self.erros = EsbocoFrequentes()
+
+    @property
+    def taxa_acerto(self) -> float:
+        validas = self.tentativas - self.invalidas
+        return self.corretas / validas if validas else float("nan")
+
+    def mediana_ate_acertar(self) -> float:
+        total = sum(self.ate_acertar)
+        if not total:
+            return float("nan")
+        acumulado = 0
+        for tentativas, contagem in enumerate(self.ate_acertar):
+            acumulado += contagem
+            if 2 * acumulado >= total:
+                return float(tentativas)
+        return float(MAX_TENTATIVAS)
+
+    def para_dicionario(self) -> dict:
+        return {
+            "tentativas": self.tentativas,
+            "corretas": self.corretas,
+            "invalidas": self.invalidas,
+            "ate_acertar": list(self.ate_acertar),
+            "erros": {valor: list(par) for valor, par in self.erros.contadores.items()},
+        }
+
+    @classmethod
+    def de_dicionario(cls, dados: dict) -> "EstatisticaItem":
+        item = cls()
+        item.tentativas = dados["tentativas"]
+        item.corretas = dados["corretas"]
+        item.invalidas = dados["invalidas"]
+        for tentativas, contagem in enumerate(dados["ate_acertar"]):
+            item.ate_acertar[min(tentativas, MAX_TENTATIVAS)] += contagem
+        item.erros.contadores = {valor: list(par) for valor, par in dados["erros"].items()}
+        return item
+
+
+def chave_valor(valor: float | str | None) -> str:
+    """
+    Agrupa valores errados numericamente próximos (4 algarismos significativos).
+    """
+    if isinstance(valor, float):
+        return f"{valor:.4g}"
+    return str(valor)
+
+
+class Estatisticas:
+    """
+    Estatísticas de todas as questões, seguras para uso por várias sessões.
+    """
+
+    def __init__(self, caminho: str | None = None, ativo: bool = True):
+        self.caminho = caminho
+        self.ativo = ativo
+        self._itens: dict[tuple[str, str], EstatisticaItem] = {}
+        # (sessão, questão, subitem) -> tentativas até agora, ou _RESOLVIDA
+        self._sessoes: OrderedDict[tuple[str, str, str], int] = OrderedDict()
+        self._trava = threading.Lock()
+        self._versao = 0
+        self._versao_salva = 0
+        if caminho and os.path.exists(caminho):
+            self.carregar(caminho)
+
+    def observar(
+        self, sessao: str, questao: str, subitem: str | None, valor: float | str | None, codigo: int,
+        variante: bool = False,
+    ) -> None:
+        if not self.ativo:
+            return
+        subitem = subitem or ""
+        with self._trava:
+            item = self._itens.get((questao, subitem))
+            if item is None:
+                item = self._itens[(questao, subitem)] = EstatisticaItem()
+            item.tentativas += 1
+            self._versao += 1
+            if codigo == INVALIDA:
+                item.invalidas += 1
+                return
+
+            chave = (sessao, questao, subitem)
+            feitas = self._sessoes.pop(chave, None)
+            if feitas != _RESOLVIDA:
+                feitas = (feitas or 0) + 1
+                if codigo == CORRETA:
+                    item.ate_acertar[min(feitas, MAX_TENTATIVAS)] += 1
+                    feitas = _RESOLVIDA
+            self._sessoes[chave] = feitas
+            if len(self._sessoes) > CAPACIDADE_SESSOES:
+                self._sessoes.popitem(last=False)
+
+            if codigo == CORRETA:
+                item.corretas += 1
+            elif not variante:
+                item.erros.observar(chave_valor(valor))
+
+    def resumo(self, erros: int = 3) -> list[dict]:
+        """
+        Uma linha por questão/subitem, na ordem em que apareceram.
+        """
+        with self._trava:
+            return [
+                {
+                    "questao": questao,
+                    "subitem": subitem,
+                    "tentativas": item.tentativas,
+                    "taxa_acerto": item.taxa_acerto,
+                    "mediana_ate_acertar": item.mediana_ate_acertar(),
+                    "erros_frequentes": item.erros.mais_frequentes(erros),
+                }
+                for (questao, subitem), item in self._itens.items()
+            ]
+
+    def para_dicionario(self) -> dict:
+        with self._trava:
+            return {
+                "max_tentativas": MAX_TENTATIVAS,
+                "itens": [[questao, subitem, item.para_dicionario()] for (questao, subitem), item in self._itens.items()],
+            }
+
+    def salvar(self, caminho: str | None = None) -> bool:
+        """
+        Grava o checkpoint se houve tentativas desde o último. Retorna se gravou.
+        """
+        caminho = caminho or self.caminho
+        if not caminho or self._versao == self._versao_salva:
+            return False
+        versao = self._versao
+        dados = self.para_dicionario()
+        temporario = caminho + ".tmp"
+        with open(temporario, "w", encoding="utf-8") as arquivo:
+            json.dump(dados, arquivo, ensure_ascii=False)
+        os.replace(temporario, caminho)
+        self._versao_salva = versao
+        return True
+
+    def carregar(self, caminho: str) -> None:
+        with open(caminho, encoding="utf-8") as arquivo:
+            dados = json.load(arquivo)
+        with self._trava:
+            self._itens = {
+                (questao, subitem): EstatisticaItem.de_dicionario(item)
+                for questao, subitem, item in dados["itens"]
+            }
+
+    def checkpoint_periodico(self, intervalo: float = INTERVALO_CHECKPOINT) -> threading.Thread:
+        def laco():
+            while True:
+                time.sleep(intervalo)
+                self.salvar()
+
+        thread = threading.Thread(target=laco, name="mecatutor-estatisticas", daemon=True)
+        thread.start()
+        atexit.register(self.salvar)
+        return thread
+
+
+def configurar(ativo: bool = False, caminho: str | None = None) -> Estatisticas:
+    """
+    Cria as estatísticas. Ficam ativas se houver arquivo de checkpoint
+    (MECATUTOR_ESTATISTICAS ou `caminho`) ou se `ativo` (painel do instrutor).
+    """
+    if caminho is None:
+        caminho = os.environ.get("MECATUTOR_ESTATISTICAS", "").strip() or None
+    estatisticas = Estatisticas(caminho, ativo=ativo or caminho is not None)
+    if caminho:
+        estatisticas.checkpoint_periodico()
+    return estatisticas
@@ -0,0 +1,90 @@
+"""
+Leitura do conteúdo a partir dos arquivos-fonte do repositório.
+
+Todo o conteúdo é endereçado por chaves de texto ("questao/2.18",
+"resumo/8", "tabela/1.5", ...). O mesmo espaço de chaves é usado pelo pacote
+binário (`mecatutor.pacote`), de modo que o app lê das fontes ou do pacote
+sem distinção.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Iterator
+
+PASTA_RESUMOS = Path(__file__).resolve().parent / "resumos"
+RAIZ = Path(__file__).resolve().parent.parent
+
+# Capítulos com resumo: id -> (rótulo do menu, título da página)
+CAPITULOS = {
+    1: ("Capítulo 1 – Introdução e Conceitos Iniciais", "Capítulo 1 – Introdução e Conceitos Iniciais"),
+    2: ("Capítulo 2 – Estática dos Fluidos", "Capítulo 2 – Estática dos Fluidos"),
+    3: ("Capítulo 3 – Dinâmica dos Fluidos (Bernoulli)", "Capítulo 3 – Dinâmica dos Fluidos (Equação de Bernoulli)"),
+    8: ("Capítulo 8 – Escoamento Viscoso em Condutos", "Capítulo 8 – Escoamento Viscoso em Condutos"),
+}
+
+
+def _questoes() -> dict:
+    from mecatutor.questoes import QUESTOES
+    return QUESTOES
+
+
+def _tabelas() -> dict:
+    from mecatutor.tabelas import TABELAS
+    return TABELAS
+
+
+def manifesto_imagens(raiz: Path = RAIZ) -> dict[str, dict]:
+    """
+    Lista as figuras em `images/` com tamanho e hash do conteúdo.
+    """
+    manifesto = {}
+    pasta = raiz / "images"
+    for nome in sorted(os.listdir(pasta)) if pasta.is_dir() else ():
+        dados = (pasta / nome).read_bytes()
+        manifesto[f"images/{nome}"] = {
+            "bytes": len(dados),
+            "sha256": hashlib.sha256(dados).hexdigest(),
+        }
+    return manifesto
+
+
+def chaves() -> Iterator[str]:
+    """
+    Todas as chaves disponíveis, na ordem em que são gravadas no pacote.
+    """
+    yield "capitulos"
+    yield "questoes/indice"
+    for qid in _questoes():
+        yield f"questao/{qid}"
+    for cap in CAPITULOS:
+        yield f"resumo/{cap}"
+    for tid in _tabelas():
+        yield f"tabela/{tid}"
+    yield "imagens"
+
+
+def ler(chave: str) -> Any:
+    """
+    Lê o item `chave` diretamente das fontes.
+    Levanta KeyError se a chave não existir.
+    """
+    tipo, _, nome = chave.partition("/")
+    if chave == "capitulos":
+        return {str(cap): list(titulos) for cap, titulos in CAPITULOS.items()}
+    if chave == "questoes/indice":
+        return {qid: q["capitulo"] for qid, q in _questoes().items()}
+    if tipo == "questao":
+        return _questoes()[nome]
+    if tipo == "resumo":
+        caminho = PASTA_RESUMOS / f"cap{int(nome):02d}.md"
+        if not caminho.exists():
+            raise KeyError(chave)
+        return caminho.read_text(encoding="utf-8")
+    if tipo == "tabela":
+        return _tabelas()[nome]
+    if chave == "imagens":
+        return manifesto_imagens()
+    raise KeyError(chave)
@@ -0,0 +1,200 @@
+"""
+Figuras das questões servidas a partir da memória.
+
+Todas as figuras são lidas do disco uma única vez, na criação do pipeline.
+As variantes (largura máxima x formato) são geradas em segundo plano logo
+após a inicialização, ou na primeira vez que são pedidas, e guardadas pelo
+hash do conteúdo original; de cada variante fica só a codificação menor entre
+PNG original, PNG otimizado e WebP sem perdas.
+
+Cada variante recebe um nome com o hash do próprio conteúdo
+(`<hash>.webp`, `<hash>.png`) e é entregue ao `st.image` como URL
+`/app/static/<nome>`: cada rerun manda só o endereço, e não a imagem.
+Bytes ou caminhos de arquivo passados ao `st.image` seriam decodificados
+a cada rerun e recodificados para PNG, e uma URI `data:` seria reenviada
+em base64 (~33% maior) em todo rerun.
+
+Quem responde a essas URLs depende de como o app é iniciado:
+
+    streamlit run servidor.py   `MiddlewareFiguras` devolve a variante da
+                                memória com `Cache-Control: public,
+                                max-age=31536000, immutable` (o nome
+                                nunca muda de conteúdo)
+    streamlit run app.py        a rota estática do Streamlit serve a cópia
+                                gravada em `static/` (requer
+                                `server.enableStaticServing`), só com
+                                ETag e Last-Modified, sem Cache-Control
+
+Sem pasta estática (uso fora do app) ou se a gravação falhar, a variante
+volta a ser uma URI `data:`.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+# Largura máxima (px) da variante para telas pequenas; None = tamanho original
+LARGURA_MOVEL = 480
+# Rota do Streamlit para a pasta `static/` ao lado do script do app
+ROTA_ESTATICA = "/app/static"
+CACHE_FIGURAS = "public, max-age=31536000, immutable"
+
+# Variantes já publicadas, por nome: (dados, tipo MIME). Compartilhado com
+# `MiddlewareFiguras`, que roda no mesmo processo que os reruns
+_publicadas: dict[str, tuple[bytes, str]] = {}
+
+
+@dataclass(frozen=True)
+class Variante:
+    dados: bytes
+    formato: str
+    largura: int
+    altura: int
+    url: str
+
+
+class PipelineImagens:
+    """
+    Guarda as figuras em memória e gera variantes sob demanda.
+    """
+
+    def __init__(
+        self, caminhos: Iterable[str], ler_arquivo: Callable[[str], bytes], pasta_estatica: str | None = None,
+    ):
+        self.pasta_estatica = pasta_estatica
+        self._originais: dict[str, bytes] = {caminho: ler_arquivo(caminho) for caminho in caminhos}
+        self._hashes = {caminho: hashlib.sha256(dados).hexdigest() for caminho, dados in self._originais.items()}
+        self._variantes: dict[tuple[str, int | None], Variante] = {}
+        self._trava = threading.Lock()
+
+    def __contains__(self, caminho: object) -> bool:
+        return caminho in self._originais
+
+    def hash_de(self, caminho: str) -> str:
+        return self._hashes[caminho]
+
+    def variante(self, caminho: str, largura_maxima: int | None = None) -> Variante:
+        """
+        Melhor variante de `caminho` com no máximo `largura_maxima` px.
+        """
+        chave = (self._hashes[caminho], largura_maxima)
+        variante = self._variantes.get(chave)
+        if variante is None:
+            variante = _codificar(self._originais[caminho], largura_maxima, self.pasta_estatica)
+            with self._trava:
+                variante = self._variantes.setdefault(chave, variante)
+        return variante
+
+    def aquecer(self, larguras: Iterable[int | None] = (None, LARGURA_MOVEL)) -> threading.Thread:
+        """
+        Gera todas as variantes em segundo plano, para que nenhuma sessão
+        pague a codificação na primeira visualização.
+        """
+        def gerar():
+            for caminho in list(self._originais):
+                for largura in larguras:
+                    self.variante(caminho, largura)
+
+        thread = threading.Thread(target=gerar, name="mecatutor-imagens", daemon=True)
+        thread.start()
+        return thread
+
+    def bytes_em_memoria(self) -> int:
+        originais = sum(len(dados) for dados in self._originais.values())
+        return originais + sum(len(v.dados) for v in list(self._variantes.values()))
+
+
+def _codificar(original: bytes, largura_maxima: int | None, pasta_estatica: str | None = None) -> Variante:
+    try:
+        from PIL import Image
+    except ImportError:  # pragma: no cover - Pillow vem com o Streamlit
+        return Variante(original, "PNG", 0, 0, _url(original, "PNG", pasta_estatica))
+
+    imagem = Image.open(io.BytesIO(original))
+    imagem.load()
+    candidatos: list[tuple[bytes, str]] = []
+    if largura_maxima is not None and imagem.width > largura_maxima:
+        altura = round(imagem.height * largura_maxima / imagem.width)
+        imagem = imagem.resize((largura_maxima, altura), Image.LANCZOS)
+    else:
+        candidatos.append((original, "PNG"))
+
+    for formato, opcoes in (("PNG", {"optimize": True}), ("WEBP", {"lossless": True, "method": 6})):
+        saida = io.BytesIO()
+        try:
+            imagem.save(saida, formato, **opcoes)
+        except (OSError, KeyError):
+            continue  # Pillow compilado sem suporte ao formato
+        candidatos.append((saida.getvalue(), formato))
+
+    dados, formato = min(candidatos, key=lambda candidato: len(candidato[0]))
+    return Variante(dados, formato, imagem.width, imagem.height, _url(dados, formato, pasta_estatica))
+
+
+def _url(dados: bytes, formato: str, pasta_estatica: str | None) -> str:
+    if pasta_estatica is None:
+        return _url_dados(dados, formato)
+    nome = f"{hashlib.sha256(dados).hexdigest()[:32]}.{formato.lower()}"
+    _publicadas[nome] = (dados, f"image/{formato.lower()}")
+    destino = os.path.join(pasta_estatica, nome)
+    try:
+        os.makedirs(pasta_estatica, exist_ok=True)
+        if not os.path.exists(destino):
+            # Grava num temporário e renomeia: o servidor nunca vê o arquivo pela metade
+            temporario = f"{destino}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporario, "wb") as arquivo:
+                arquivo.write(dados)
+            os.replace(temporario, destino)
+    except OSError:
+        return _url_dados(dados, formato)
+    return f"{ROTA_ESTATICA}/{nome}"
+
+
+def _url_dados(dados: bytes, formato: str) -> str:
+    return f"data:image/{formato.lower()};base64,{base64.b64encode(dados).decode('ascii')}"
+
+
+class MiddlewareFiguras:
+    """
+    Middleware ASGI para `st.App` (ver `servidor.py`): responde às URLs das
+    variantes publicadas direto da memória, com CACHE_FIGURAS. Os demais
+    pedidos seguem para o Streamlit.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            pasta, _, nome = scope["path"].rpartition("/")
+            publicada = _publicadas.get(nome) if pasta.endswith(ROTA_ESTATICA) else None
+            if publicada is not None:
+                dados, tipo = publicada
+                await send({
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", tipo.encode("ascii")),
+                        (b"content-length", str(len(dados)).encode("ascii")),
+                        (b"cache-control", CACHE_FIGURAS.encode("ascii")),
+                        (b"x-content-type-options", b"nosniff"),
+                    ],
+                })
+                await send({"type": "http.response.body", "body": dados if scope["method"] == "GET" else b""})
+                return
+        await self.app(scope, receive, send)
+
+
+def cliente_movel(cabecalhos) -> bool:
+    """
+    Detecta celulares pelos cabeçalhos da sessão (`st.context.headers`).
+    """
+    if cabecalhos.get("Sec-CH-UA-Mobile") == "?1":
+        return True
+    return "Mobi" in cabecalhos.get("User-Agent", "")
@@ -0,0 +1,55 @@
+"""
+Índice de navegação capítulo -> questões, montado uma vez junto com o banco.
+"""
+
+from __future__ import annotations
+
+import re
+from types import MappingProxyType
+from typing import Mapping
+
+_PARTES = re.compile(r"(\d+)")
+
+
+def chave_natural(questao_id: str) -> tuple:
+    """
+    Chave de ordenação natural: "2.9" < "2.18" e "8.46" < "8.100".
+    """
+    return tuple(
+        (0, int(parte)) if parte.isdigit() else (1, parte)
+        for parte in _PARTES.split(questao_id) if parte
+    )
+
+
+class IndiceNavegacao:
+    """
+    Listas ordenadas de questões por capítulo e vizinhos (anterior/próxima),
+    com consultas O(1). A navegação atravessa os capítulos em ordem.
+    """
+
+    def __init__(self, capitulo_por_questao: Mapping[str, int]):
+        por_capitulo: dict[int, list[str]] = {}
+        for qid, capitulo in capitulo_por_questao.items():
+            por_capitulo.setdefault(capitulo, []).append(qid)
+
+        self.capitulos: tuple[int, ...] = tuple(sorted(por_capitulo))
+        self._por_capitulo = MappingProxyType({
+            cap: tuple(sorted(por_capitulo[cap], key=chave_natural)) for cap in self.capitulos
+        })
+
+        ordem = [qid for cap in self.capitulos for qid in self._por_capitulo[cap]]
+        self._capitulo_de = MappingProxyType(dict(capitulo_por_questao))
+        self._anterior = MappingProxyType(dict(zip(ordem[1:], ordem[:-1])))
+        self._proxima = MappingProxyType(dict(zip(ordem[:-1], ordem[1:])))
+
+    def ids(self, capitulo: int) -> tuple[str, ...]:
+        return self._por_capitulo.get(capitulo, ())
+
+    def capitulo_de(self, questao_id: str) -> int:
+        return self._capitulo_de[questao_id]
+
+    def anterior(self, questao_id: str) -> str | None:
+        return self._anterior.get(questao_id)
+
+    def proxima(self, questao_id: str) -> str | None:
+        return self._proxima.get(questao_id)
@@ -0,0 +1,153 @@
+"""
+Pré-renderização no servidor dos blocos `$$...$$` de resumos e resoluções.
+
+Cada bloco é convertido para MathML (renderizado nativamente pelo navegador),
+poupando o KaTeX de tipografar dezenas de equações no celular do aluno a cada
+clique em "Ver resolução". O resultado fica em cache indexado pelo hash do
+conteúdo, em memória e em disco, e pode ser gerado antes do deploy com:
+
+    python -m mecatutor.latex
+
+Se o `latex2mathml` não estiver instalado, ou se um bloco usar um comando que
+ele não conhece, o bloco original é mantido e o KaTeX o renderiza no navegador.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sys
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+# Muda sempre que o formato do HTML gerado mudar, invalidando o cache em disco
+VERSAO_RENDERIZADOR = "1"
+
+# Bloco $$...$$ ocupando linhas inteiras (com a indentação da lista, se houver)
+BLOCO_MATEMATICO = re.compile(r"^([ \t]*)\$\$((?:(?!\$\$).)+?)\$\$[ \t]*$", re.DOTALL | re.MULTILINE)
+
+PASTA_CACHE = Path(os.environ.get("MECATUTOR_CACHE", Path(tempfile.gettempdir()) / "mecatutor")) / "latex"
+
+
+@lru_cache(maxsize=None)
+def _conversor():
+    """
+    Importa o latex2mathml só quando a primeira equação for convertida.
+    """
+    try:
+        from latex2mathml.converter import convert
+    except ImportError:  # pragma: no cover - dependência opcional
+        return None
+    return convert
+
+
+def disponivel() -> bool:
+    return _conversor() is not None
+
+
+def _chave(texto: str) -> str:
+    return hashlib.sha256(f"{VERSAO_RENDERIZADOR}\0{texto}".encode("utf-8")).hexdigest()
+
+
+class CacheLatex:
+    """
+    Cache de documentos pré-renderizados: memória na frente, disco atrás.
+    """
+
+    def __init__(self, pasta: Path | None = PASTA_CACHE):
+        self.pasta = pasta
+        self._memoria: dict[str, str] = {}
+        self._trava = threading.Lock()
+        self.acertos_memoria = 0
+        self.acertos_disco = 0
+        self.renderizacoes = 0
+
+    def _ler_disco(self, chave: str) -> str | None:
+        if self.pasta is None:
+            return None
+        try:
+            return (self.pasta / f"{chave}.md").read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _gravar_disco(self, chave: str, texto: str) -> None:
+        if self.pasta is None:
+            return
+        try:
+            self.pasta.mkdir(parents=True, exist_ok=True)
+            temporario = self.pasta / f"{chave}.{os.getpid()}.tmp"
+            temporario.write_text(texto, encoding="utf-8")
+            os.replace(temporario, self.pasta / f"{chave}.md")
+        except OSError:
+            pass  # Sem disco gravável o cache em memória continua valendo
+
+    def renderizar(self, markdown: str) -> str:
+        """
+        Retorna `markdown` com os blocos `$$...$$` já convertidos em MathML.
+        """
+        if "$$" not in markdown or not disponivel():
+            return markdown
+        chave = _chave(markdown)
+        resultado = self._memoria.get(chave)
+        if resultado is not None:
+            self.acertos_memoria += 1
+            return resultado
+        resultado = self._ler_disco(chave)
+        if resultado is not None:
+            self.acertos_disco += 1
+        else:
+            resultado = pre_renderizar(markdown)
+            self.renderizacoes += 1
+            self._gravar_disco(chave, resultado)
+        with self._trava:
+            self._memoria[chave] = resultado
+        return resultado
+
+
+def _converter_bloco(correspondencia: re.Match) -> str:
+    indentacao, latex = correspondencia.group(1), correspondencia.group(2).strip()
+    try:
+        mathml = _conversor()(latex, display="block")
+    except Exception:
+        return correspondencia.group(0)
+    # O <div> abre um bloco HTML do Markdown, que vai até a próxima linha em
+    # branco; por isso a linha vazia ao final é obrigatória.
+    return f"{indentacao}<div class=\"mt-math\">\n{indentacao}{mathml}\n{indentacao}</div>\n"
+
+
+def pre_renderizar(markdown: str) -> str:
+    """
+    Converte cada bloco `$$...$$` em MathML, sem usar cache.
+    """
+    if not disponivel():
+        return markdown
+    return BLOCO_MATEMATICO.sub(_converter_bloco, markdown)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Pré-renderiza todos os resumos e resoluções para o cache em disco.
+    """
+    from mecatutor.conteudo import Conteudo
+
+    if not disponivel():
+        print("latex2mathml não está instalado; nada a fazer.")
+        return 1
+    conteudo = Conteudo.abrir()
+    cache = CacheLatex()
+    textos = [q.resolucao for q in conteudo.banco().questoes()]
+    resumos = conteudo.resumos()
+    for capitulo in resumos.capitulos():
+        textos.extend(texto for tipo, texto in resumos.get(capitulo).blocos if tipo == "markdown")
+    for texto in textos:
+        cache.renderizar(texto)
+    print(f"{len(textos)} documentos; {cache.renderizacoes} renderizados, "
+          f"{cache.acertos_disco} já estavam em {cache.pasta}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
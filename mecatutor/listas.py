@@ -0,0 +1,241 @@
+"""
+Listas de exercícios personalizadas para uma turma inteira.
+
+`compilar` sorteia, para cada aluno e cada questão da lista, a variante do
+aluno (ver `mecatutor.variantes`) e grava tudo, gabarito incluído, num
+arquivo compacto. A geração é distribuída por questão num pool de
+processos; em cada processo todos os alunos são resolvidos de uma vez.
+Formato:
+
+    cabeçalho  : "MTLS" | versão do formato (u16) | tamanho do índice (u32)
+    índice     : JSON {"nome", "versao", "alunos": [...], "questoes": {id: [coluna, parâmetros, subitens]}, "largura"}
+    dados      : matriz float64 alunos x largura (alinhada a 8 bytes)
+
+Cada linha da matriz é um aluno: a semente, depois, para cada questão, os
+dados sorteados, as respostas e as tolerâncias dos subitens. Na leitura o
+arquivo é mapeado em memória e a matriz é vista sem cópia, então "aluno X,
+questão 8.46" é um acesso direto à linha e às colunas da questão.
+
+    python -m mecatutor.listas alunos.txt --nome "P1 2026/2" --saida p1.mtls
+    python -m mecatutor.listas alunos.txt --nome "P1 2026/2" --saida p1.mtls --questoes 2.27 8.46 --gabarito p1.csv
+
+`alunos.txt` tem um identificador por linha (ou um CSV com a coluna `aluno`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+import mmap
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable
+
+import numpy as np
+
+from mecatutor.banco import Questao
+from mecatutor.variantes import MODELOS, LoteVariantes, montar
+
+MAGICO = b"MTLS"
+VERSAO_FORMATO = 1
+_CABECALHO = struct.Struct("<4sHI")
+
+_catalogo = None
+
+
+def semente_de(nome: str, aluno: str) -> int:
+    """
+    Semente (31 bits) de um aluno numa lista; a mesma a cada recompilação.
+    """
+    resumo = hashlib.blake2b(f"{nome}/{aluno}".encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(resumo, "little") >> 1
+
+
+def ler_alunos(caminho: str) -> list[str]:
+    with open(caminho, encoding="utf-8", newline="") as arquivo:
+        linhas = [linha.strip() for linha in arquivo if linha.strip()]
+    if linhas and "," in linhas[0] and "aluno" in linhas[0].split(","):
+        return [registro["aluno"].strip() for registro in csv.DictReader(linhas)]
+    return list(dict.fromkeys(linhas))
+
+
+def _iniciar_processo(caminho_pacote: str | None) -> None:
+    global _catalogo
+    from mecatutor.conteudo import Conteudo
+    _catalogo = Conteudo.abrir(caminho_pacote).variantes()
+
+
+def gerar_colunas(questao_id: str, sementes: np.ndarray) -> np.ndarray:
+    """
+    Colunas de uma questão para todos os alunos: dados sorteados,
+    respostas e tolerâncias. Questões sem modelo repetem o gabarito.
+    """
+    questao = _catalogo.banco[questao_id]
+    subitens = questao.subitens or (None,)
+    if _catalogo.tem_modelo(questao_id):
+        lote = _catalogo.gerar(questao_id, sementes)
+        colunas = [*lote.exibidos.values(), *(lote.respostas[s] for s in subitens), *(lote.tolerancias[s] for s in subitens)]
+    else:
+        colunas = [float(questao.resposta_de(s)) for s in subitens] + [float(questao.tolerancia_de(s)) for s in subitens]
+    return np.column_stack([np.broadcast_to(coluna, sementes.shape) for coluna in colunas])
+
+
+def compilar(
+    destino: str,
+    nome: str,
+    alunos: Iterable[str],
+    questoes: Iterable[str] | None = None,
+    processos: int | None = None,
+    caminho_pacote: str | None = None,
+) -> str:
+    """
+    Gera a lista em `destino` e retorna a versão (hash do conteúdo). Com
+    `processos=0` gera no próprio processo.
+    """
+    alunos = list(dict.fromkeys(alunos))
+    sementes = np.array([semente_de(nome, aluno) for aluno in alunos], dtype=np.uint64)
+
+    _iniciar_processo(caminho_pacote)
+    banco = _catalogo.banco
+    if questoes is None:
+        questoes = [questao.id for questao in banco.questoes() if questao.tipo != "texto"]
+    else:
+        questoes = [questao_id for questao_id in dict.fromkeys(questoes) if banco[questao_id].tipo != "texto"]
+
+    if processos == 0:
+        blocos = [gerar_colunas(questao_id, sementes) for questao_id in questoes]
+    else:
+        with ProcessPoolExecutor(processos, initializer=_iniciar_processo, initargs=(caminho_pacote,)) as executor:
+            blocos = list(executor.map(gerar_colunas, questoes, [sementes] * len(questoes)))
+
+    layout, coluna = {}, 1
+    for questao_id, bloco in zip(questoes, blocos):
+        parametros = [faixa.parametro for faixa in MODELOS[questao_id]] if _catalogo.tem_modelo(questao_id) else []
+        layout[questao_id] = [coluna, parametros, list(banco[questao_id].subitens)]
+        coluna += bloco.shape[1]
+    matriz = np.column_stack([sementes.astype(np.float64), *blocos]).astype("<f8")
+
+    dados = matriz.tobytes()
+    versao = hashlib.sha256(json.dumps(layout).encode("utf-8") + dados).hexdigest()[:16]
+    indice = json.dumps(
+        {"nome": nome, "versao": versao, "alunos": alunos, "questoes": layout, "largura": matriz.shape[1]},
+        ensure_ascii=False, separators=(",", ":"),
+    ).encode("utf-8")
+    indice += b" " * (-(_CABECALHO.size + len(indice)) % 8)
+    with open(destino, "wb") as arquivo:
+        arquivo.write(_CABECALHO.pack(MAGICO, VERSAO_FORMATO, len(indice)))
+        arquivo.write(indice)
+        arquivo.write(dados)
+    return versao
+
+
+class ListaExercicios:
+    """
+    Leitor da lista mapeada em memória.
+    """
+
+    def __init__(self, caminho: str):
+        with open(caminho, "rb") as arquivo:
+            self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        magico, versao_formato, tamanho_indice = _CABECALHO.unpack_from(self._mapa, 0)
+        if magico != MAGICO:
+            raise ValueError(f"{caminho} não é uma lista de exercícios")
+        if versao_formato != VERSAO_FORMATO:
+            raise ValueError(f"Versão de lista {versao_formato} não suportada (esperado {VERSAO_FORMATO})")
+        inicio = _CABECALHO.size
+        indice = json.loads(self._mapa[inicio:inicio + tamanho_indice])
+        self.nome: str = indice["nome"]
+        self.versao: str = indice["versao"]
+        self.alunos: list[str] = indice["alunos"]
+        self._linhas = {aluno: linha for linha, aluno in enumerate(self.alunos)}
+        self._questoes: dict[str, list] = indice["questoes"]
+        self._matriz = np.frombuffer(
+            self._mapa, dtype="<f8", count=len(self.alunos) * indice["largura"], offset=inicio + tamanho_indice,
+        ).reshape(len(self.alunos), indice["largura"])
+
+    def __contains__(self, aluno: object) -> bool:
+        return aluno in self._linhas
+
+    @property
+    def questoes(self) -> list[str]:
+        return list(self._questoes)
+
+    def semente(self, aluno: str) -> int:
+        return int(self._matriz[self._linhas[aluno], 0])
+
+    def lote(self, aluno: str, questao_id: str) -> LoteVariantes:
+        """
+        A variante de um aluno como um lote de um elemento. Levanta KeyError
+        se o aluno ou a questão não estiverem na lista.
+        """
+        coluna, parametros, subitens = self._questoes[questao_id]
+        linha = self._matriz[self._linhas[aluno]]
+        subitens = subitens or [None]
+        valores = linha[coluna:coluna + len(parametros) + 2 * len(subitens), np.newaxis]
+        respostas = valores[len(parametros):len(parametros) + len(subitens)]
+        tolerancias = valores[len(parametros) + len(subitens):]
+        return LoteVariantes(
+            questao_id, linha[:1].astype(np.uint64),
+            dict(zip(parametros, valores)), dict(zip(subitens, respostas)), dict(zip(subitens, tolerancias)),
+        )
+
+    def questao(self, aluno: str, questao: Questao) -> Questao:
+        """
+        A questão como o aluno a recebeu; a original se ela não tiver
+        variante na lista.
+        """
+        if questao.id not in self._questoes or not self._questoes[questao.id][1]:
+            return questao
+        return montar(questao, self.lote(aluno, questao.id), 0)
+
+    def gabarito(self) -> Iterable[tuple[str, int, str, str, float, float]]:
+        """
+        (aluno, semente, questão, subitem, resposta, tolerância) de toda a lista.
+        """
+        for aluno in self.alunos:
+            for questao_id in self._questoes:
+                lote = self.lote(aluno, questao_id)
+                for subitem, resposta in lote.respostas.items():
+                    yield (aluno, int(lote.sementes[0]), questao_id, subitem or "",
+                           float(resposta[0]), float(lote.tolerancias[subitem][0]))
+
+    def fechar(self) -> None:
+        # A visão NumPy precisa sair antes, senão o mmap se recusa a fechar
+        del self._matriz
+        self._mapa.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Gera uma lista de exercícios personalizada por aluno.")
+    parser.add_argument("alunos", help="um aluno por linha, ou CSV com a coluna aluno")
+    parser.add_argument("--nome", required=True, help="nome da lista; entra na semente de cada aluno")
+    parser.add_argument("--saida", default="lista.mtls")
+    parser.add_argument("--questoes", nargs="*", default=None, help="padrão: todas as questões numéricas")
+    parser.add_argument("--processos", type=int, default=None, help="padrão: número de núcleos; 0 = sem pool")
+    parser.add_argument("--pacote", default=None, help="lê as questões de um conteudo.pak")
+    parser.add_argument("--gabarito", default=None, help="também grava o gabarito neste CSV")
+    argumentos = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    alunos = ler_alunos(argumentos.alunos)
+    versao = compilar(
+        argumentos.saida, argumentos.nome, alunos, argumentos.questoes, argumentos.processos, argumentos.pacote,
+    )
+    lista = ListaExercicios(argumentos.saida)
+    if argumentos.gabarito:
+        with open(argumentos.gabarito, "w", encoding="utf-8", newline="") as arquivo:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(("aluno", "semente", "questao", "subitem", "resposta", "tolerancia"))
+            escritor.writerows(lista.gabarito())
+    print(f"Lista {argumentos.saida} gerada (versão {versao}): {len(alunos)} alunos x "
+          f"{len(lista.questoes)} questões em {time.perf_counter() - inicio:.1f} s.")
+    lista.fechar()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+"""
+Correção offline de respostas coletadas fora do app, com as mesmas regras
+de `mecatutor.correcao`.
+
+A entrada é um CSV (com cabeçalho) ou JSONL com os campos `aluno`,
+`questao`, `subitem` (vazio para resposta única) e `resposta`. O arquivo é
+lido em blocos e cada bloco é corrigido em um processo do pool; só
+`--em-voo` blocos ficam em memória ao mesmo tempo, então o consumo não
+depende do tamanho do arquivo.
+
+Saídas em `--saida`:
+
+    correcoes.csv     uma linha por resposta com o resultado, escrita bloco a bloco
+    por_aluno.csv     totais por aluno, regravado ao fim de cada bloco
+    por_questao.csv   totais por questão/subitem, regravado ao fim de cada bloco
+
+    python -m mecatutor.lote respostas.csv --saida relatorios/
+    python -m mecatutor.lote respostas.jsonl --saida relatorios/ --processos 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator
+
+from mecatutor.correcao import CORRETA, INCORRETA, INVALIDA, corrigir_lote
+
+# Questão ou subitem que não existe no banco
+DESCONHECIDA = -2
+
+CAMPOS = ("aluno", "questao", "subitem", "resposta")
+RESULTADOS = {CORRETA: "correta", INCORRETA: "incorreta", INVALIDA: "invalida", DESCONHECIDA: "desconhecida"}
+COLUNAS_TOTAIS = ("respostas", "corretas", "incorretas", "invalidas", "desconhecidas")
+_POSICAO = {CORRETA: 1, INCORRETA: 2, INVALIDA: 3, DESCONHECIDA: 4}
+
+TAMANHO_BLOCO = 20_000
+
+_banco = None
+
+
+def ler_respostas(caminho: str, formato: str | None = None) -> Iterator[tuple[str, str, str, str]]:
+    """
+    Percorre o arquivo linha a linha, devolvendo (aluno, questao, subitem, resposta).
+    """
+    formato = formato or ("jsonl" if caminho.endswith((".jsonl", ".ndjson")) else "csv")
+    with open(caminho, encoding="utf-8", newline="") as arquivo:
+        if formato == "csv":
+            registros = csv.DictReader(arquivo)
+        else:
+            registros = (json.loads(linha) for linha in arquivo if linha.strip())
+        for registro in registros:
+            # Campo ausente ou nulo vira ""; uma resposta numérica 0 continua "0"
+            yield tuple(_texto(registro.get(campo)) for campo in CAMPOS)
+
+
+def _texto(valor) -> str:
+    return "" if valor is None else str(valor).strip()
+
+
+def blocos(linhas: Iterable, tamanho: int) -> Iterator[list]:
+    iterador = iter(linhas)
+    while bloco := list(islice(iterador, tamanho)):
+        yield bloco
+
+
+def _iniciar_processo(caminho_pacote: str | None) -> None:
+    global _banco
+    from mecatutor.conteudo import Conteudo
+    _banco = Conteudo.abrir(caminho_pacote).banco()
+
+
+def corrigir_bloco(bloco: list[tuple[str, str, str, str]]):
+    """
+    Corrige um bloco agrupando as respostas por (questão, subitem), para que
+    cada grupo seja comparado de uma vez por `corrigir_lote`. Retorna um
+    código int8 por linha, na ordem do bloco.
+    """
+    import numpy as np
+
+    grupos: dict[tuple[str, str], list[int]] = {}
+    for i, (_, questao_id, subitem, _) in enumerate(bloco):
+        grupos.setdefault((questao_id, subitem), []).append(i)
+
+    codigos = np.full(len(bloco), DESCONHECIDA, dtype=np.int8)
+    for (questao_id, subitem), posicoes in grupos.items():
+        questao = _banco.get(questao_id)
+        if questao is None:
+            continue
+        # Subitem inexistente, ou subitem informado numa questão de resposta única
+        valido = subitem in questao.subitens if questao.tem_subitens else not subitem
+        if not valido:
+            continue
+        respostas = [bloco[i][3] for i in posicoes]
+        codigos[posicoes] = corrigir_lote(questao, respostas, subitem or None)
+    return codigos
+
+
+class Totais:
+    """
+    Contadores por chave; o tamanho cresce com o número de alunos/questões,
+    não com o número de respostas.
+    """
+
+    def __init__(self, colunas_chave: tuple[str, ...]):
+        self.colunas_chave = colunas_chave
+        self._contagens: dict[tuple, list[int]] = {}
+
+    def somar(self, chave: tuple, codigo: int) -> None:
+        contagem = self._contagens.get(chave)
+        if contagem is None:
+            contagem = self._contagens[chave] = [0] * len(COLUNAS_TOTAIS)
+        contagem[0] += 1
+        contagem[_POSICAO[codigo]] += 1
+
+    def gravar(self, caminho: str) -> None:
+        temporario = caminho + ".tmp"
+        with open(temporario, "w", encoding="utf-8", newline="") as arquivo:
+            escritor = csv.writer(arquivo)
+            escritor.writerow((*self.colunas_chave, *COLUNAS_TOTAIS, "taxa_acerto"))
+            for chave, contagem in sorted(self._contagens.items()):
+                escritor.writerow((*chave, *contagem, f"{contagem[1] / contagem[0]:.4f}"))
+        os.replace(temporario, caminho)
+
+
+def corrigir_arquivo(
+    entrada: str,
+    saida: str,
+    processos: int | None = None,
+    tamanho_bloco: int = TAMANHO_BLOCO,
+    em_voo: int | None = None,
+    formato: str | None = None,
+    caminho_pacote: str | None = None,
+) -> int:
+    """
+    Corrige todo o arquivo e grava os relatórios em `saida`. Retorna o
+    número de respostas processadas. Com `processos=0` corrige no próprio
+    processo.
+    """
+    os.makedirs(saida, exist_ok=True)
+    por_aluno = Totais(("aluno",))
+    por_questao = Totais(("questao", "subitem"))
+    total = 0
+    inicio = time.perf_counter()
+
+    if processos == 0:
+        _iniciar_processo(caminho_pacote)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(processos, initializer=_iniciar_processo, initargs=(caminho_pacote,))
+        em_voo = em_voo or 2 * (processos or os.cpu_count() or 1)
+
+    with open(os.path.join(saida, "correcoes.csv"), "w", encoding="utf-8", newline="") as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow((*CAMPOS, "resultado"))
+
+        def consumir(bloco, codigos) -> None:
+            nonlocal total
+            for (aluno, questao_id, subitem, resposta), codigo in zip(bloco, codigos.tolist()):
+                escritor.writerow((aluno, questao_id, subitem, resposta, RESULTADOS[codigo]))
+                por_aluno.somar((aluno,), codigo)
+                por_questao.somar((questao_id, subitem), codigo)
+            total += len(bloco)
+            arquivo.flush()
+            por_aluno.gravar(os.path.join(saida, "por_aluno.csv"))
+            por_questao.gravar(os.path.join(saida, "por_questao.csv"))
+            print(f"{total} respostas corrigidas ({time.perf_counter() - inicio:.1f} s)", file=sys.stderr)
+
+        if executor is None:
+            for bloco in blocos(ler_respostas(entrada, formato), tamanho_bloco):
+                consumir(bloco, corrigir_bloco(bloco))
+        else:
+            with executor:
+                pendentes: deque = deque()
+                for bloco in blocos(ler_respostas(entrada, formato), tamanho_bloco):
+                    pendentes.append((bloco, executor.submit(corrigir_bloco, bloco)))
+                    if len(pendentes) >= em_voo:
+                        bloco_pronto, futuro = pendentes.popleft()
+                        consumir(bloco_pronto, futuro.result())
+                while pendentes:
+                    bloco_pronto, futuro = pendentes.popleft()
+                    consumir(bloco_pronto, futuro.result())
+
+    if total == 0:
+        por_aluno.gravar(os.path.join(saida, "por_aluno.csv"))
+        por_questao.gravar(os.path.join(saida, "por_questao.csv"))
+    return total
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Corrige em lote respostas de um CSV ou JSONL.")
+    parser.add_argument("entrada")
+    parser.add_argument("--saida", default="relatorios")
+    parser.add_argument("--formato", choices=("csv", "jsonl"), help="padrão: pela extensão do arquivo")
+    parser.add_argument("--processos", type=int, default=None, help="padrão: número de núcleos; 0 = sem pool")
+    parser.add_argument("--bloco", type=int, default=TAMANHO_BLOCO, help="respostas por bloco")
+    parser.add_argument("--em-voo", type=int, default=None, help="blocos em memória ao mesmo tempo")
+    parser.add_argument("--pacote", default=None, help="lê as questões de um conteudo.pak")
+    argumentos = parser.parse_args(argv)
+
+    total = corrigir_arquivo(
+        argumentos.entrada, argumentos.saida, argumentos.processos, argumentos.bloco,
+        argumentos.em_voo, argumentos.formato, argumentos.pacote,
+    )
+    print(f"{total} respostas; relatórios em {argumentos.saida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""
+Medição de tempo por seção do app (resumos, banco de questões, imagens,
+correção), agregada em histogramas por seção, página e item.
+
+Ativada pela variável de ambiente MECATUTOR_METRICAS:
+
+    (vazia)              desativada; `medir` devolve um contexto nulo compartilhado
+    prometheus[:porta]   expõe /metrics em formato texto Prometheus em 127.0.0.1
+                         (porta padrão 9464)
+    json[:segundos]      escreve periodicamente uma linha JSON com os histogramas
+                         no logger "mecatutor.metricas" (padrão a cada 60 s)
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Limites superiores dos buckets, em segundos
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+PORTA_PADRAO = 9464
+INTERVALO_JSON_PADRAO = 60.0
+
+_NULO = nullcontext()
+logger = logging.getLogger("mecatutor.metricas")
+
+# Registros já criados por `configurar`, por especificação: limpar o
+# `st.cache_resource` chama o carregador de novo, e o exportador (porta
+# HTTP ou thread JSON) não pode ser iniciado duas vezes no mesmo processo
+_configurados: dict[str, Metricas] = {}
+_trava_configuracao = threading.Lock()
+
+
+class Histograma:
+    __slots__ = ("contagens", "soma", "total")
+
+    def __init__(self):
+        self.contagens = [0] * (len(BUCKETS) + 1)
+        self.soma = 0.0
+        self.total = 0
+
+    def observar(self, segundos: float) -> None:
+        self.contagens[bisect.bisect_left(BUCKETS, segundos)] += 1
+        self.soma += segundos
+        self.total += 1
+
+
+class Metricas:
+    """
+    Registro de histogramas indexados por (seção, página, item).
+    """
+
+    def __init__(self, ativo: bool = True):
+        self.ativo = ativo
+        self._histogramas: dict[tuple[str, str, str], Histograma] = {}
+        self._trava = threading.Lock()
+
+    def medir(self, secao: str, pagina: str = "", item: str = ""):
+        """
+        Context manager que cronometra o bloco. Sem custo se desativado.
+        """
+        if not self.ativo:
+            return _NULO
+        return self._medir((secao, pagina, str(item)))
+
+    @contextmanager
+    def _medir(self, chave: tuple[str, str, str]):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observar(chave, time.perf_counter() - inicio)
+
+    def observar(self, chave: tuple[str, str, str], segundos: float) -> None:
+        with self._trava:
+            histograma = self._histogramas.get(chave)
+            if histograma is None:
+                histograma = self._histogramas[chave] = Histograma()
+            histograma.observar(segundos)
+
+    def _copia(self) -> list[tuple[tuple[str, str, str], list[int], float, int]]:
+        with self._trava:
+            return [(chave, list(h.contagens), h.soma, h.total) for chave, h in sorted(self._histogramas.items())]
+
+    def texto_prometheus(self) -> str:
+        nome = "mecatutor_secao_segundos"
+        linhas = [
+            f"# HELP {nome} Tempo gasto em cada seção do app por rerun.",
+            f"# TYPE {nome} histogram",
+        ]
+        for (secao, pagina, item), contagens, soma, total in self._copia():
+            rotulos = f'secao="{_escapar(secao)}",pagina="{_escapar(pagina)}",item="{_escapar(item)}"'
+            acumulado = 0
+            for limite, contagem in zip(BUCKETS, contagens):
+                acumulado += contagem
+                linhas.append(f'{nome}_bucket{{{rotulos},le="{limite}"}} {acumulado}')
+            linhas.append(f'{nome}_bucket{{{rotulos},le="+Inf"}} {total}')
+            linhas.append(f"{nome}_sum{{{rotulos}}} {soma:.6f}")
+            linhas.append(f"{nome}_count{{{rotulos}}} {total}")
+        return "\n".join(linhas) + "\n"
+
+    def linha_json(self) -> str:
+        return json.dumps({
+            "evento": "mecatutor_metricas",
+            "buckets": list(BUCKETS),
+            "secoes": [
+                {"secao": secao, "pagina": pagina, "item": item,
+                 "contagens": contagens, "soma": round(soma, 6), "total": total}
+                for (secao, pagina, item), contagens, soma, total in self._copia()
+            ],
+        }, ensure_ascii=False)
+
+    def servir_prometheus(self, porta: int = PORTA_PADRAO, endereco: str = "127.0.0.1") -> ThreadingHTTPServer:
+        metricas = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                corpo = metricas.texto_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(corpo)))
+                self.end_headers()
+                self.wfile.write(corpo)
+
+            def log_message(self, *args):
+                pass
+
+        servidor = ThreadingHTTPServer((endereco, porta), Handler)
+        threading.Thread(target=servidor.serve_forever, name="mecatutor-metricas", daemon=True).start()
+        return servidor
+
+    def registrar_json(self, intervalo: float = INTERVALO_JSON_PADRAO) -> threading.Thread:
+        if not logger.handlers:
+            logger.addHandler(logging.StreamHandler())
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+
+        def laco():
+            while True:
+                time.sleep(intervalo)
+                logger.info(self.linha_json())
+
+        thread = threading.Thread(target=laco, name="mecatutor-metricas-json", daemon=True)
+        thread.start()
+        return thread
+
+
+def _escapar(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def configurar(especificacao: str | None = None) -> Metricas:
+    """
+    Cria o registro conforme MECATUTOR_METRICAS (ou `especificacao`) e inicia
+    o exportador correspondente. Chamadas seguintes com a mesma
+    especificação devolvem o mesmo registro, sem iniciar outro exportador.
+    """
+    if especificacao is None:
+        especificacao = os.environ.get("MECATUTOR_METRICAS", "")
+    modo, _, parametro = especificacao.strip().lower().partition(":")
+    if not modo:
+        return Metricas(ativo=False)
+
+    with _trava_configuracao:
+        chave = f"{modo}:{parametro}"
+        if chave in _configurados:
+            return _configurados[chave]
+        metricas = Metricas()
+        if modo == "prometheus":
+            metricas.servir_prometheus(int(parametro or PORTA_PADRAO))
+        elif modo == "json":
+            metricas.registrar_json(float(parametro or INTERVALO_JSON_PADRAO))
+        else:
+            raise ValueError(f"MECATUTOR_METRICAS inválida: {especificacao!r} (use prometheus[:porta] ou json[:segundos])")
+        _configurados[chave] = metricas
+        return metricas
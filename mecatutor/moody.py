@@ -0,0 +1,190 @@
+"""
+Diagrama de Moody: grade pré-calculada de f(Re, ε/D) e gráfico.
+
+A grade cobre o regime turbulento do diagrama (Re de RE_LAMINAR a 10⁸,
+ε/D de 10⁻⁸ a 0,05) com log f em nós igualmente espaçados em log Re e
+log ε/D. Uma consulta calcula o índice da célula por aritmética e
+interpola bilinearmente em log-log, então custa O(1) por ponto e não
+chama Colebrook; no regime laminar devolve 64/Re exato. Fora da grade o
+ponto é levado à borda (ε/D < 10⁻⁸ é tubo liso nessa faixa de Re).
+
+O gráfico (curvas de ε/D constante, como no livro) é uma especificação
+Vega-Lite montada uma única vez a partir da grade; cada questão só
+acrescenta a camada com o seu ponto de operação, sem validar nem
+reconstruir as curvas.
+
+    >>> grade = GradeMoody()
+    >>> round(float(grade.consultar(1e5, 0.001)), 4)
+    0.0222
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from mecatutor.atrito import RE_LAMINAR, fator_atrito
+
+RE_MIN, RE_MAX = 1e3, 1e8
+RUGOSIDADE_MIN, RUGOSIDADE_MAX = 1e-8, 0.05
+PONTOS_RE = 256
+PONTOS_RUGOSIDADE = 128
+# Pontos por curva no gráfico (as curvas são suaves em log-log)
+PONTOS_CURVA = 64
+
+# Curvas de ε/D constante desenhadas no diagrama (0 = tubo liso)
+CURVAS = (0.05, 0.04, 0.03, 0.02, 0.015, 0.01, 0.005, 0.002, 0.001, 5e-4, 2e-4, 1e-4, 5e-5, 1e-5, 5e-6, 1e-6, 0.0)
+
+
+class GradeMoody:
+    """
+    log10 f em uma grade (log10 Re, log10 ε/D), somente leitura depois de montada.
+    """
+
+    def __init__(self, pontos_re: int = PONTOS_RE, pontos_rugosidade: int = PONTOS_RUGOSIDADE):
+        self.log_re = np.linspace(math.log10(RE_LAMINAR), math.log10(RE_MAX), pontos_re)
+        self.log_rugosidade = np.linspace(math.log10(RUGOSIDADE_MIN), math.log10(RUGOSIDADE_MAX), pontos_rugosidade)
+        f = fator_atrito(10 ** self.log_re[:, np.newaxis], 10 ** self.log_rugosidade[np.newaxis, :])
+        self.log_f = np.log10(f)
+        self.log_f.setflags(write=False)
+        # Cópias em Python puro para a consulta escalar
+        self._lista_log_f = self.log_f.tolist()
+        self._origem = (float(self.log_re[0]), float(self.log_rugosidade[0]))
+        self._passo = (float(self.log_re[1] - self.log_re[0]), float(self.log_rugosidade[1] - self.log_rugosidade[0]))
+
+    def consultar(self, reynolds, rugosidade_relativa):
+        """
+        f aproximado (interpolação bilinear em log-log), vetorizado.
+        """
+        if np.ndim(reynolds) == 0 and np.ndim(rugosidade_relativa) == 0:
+            return self._consultar_escalar(float(reynolds), float(rugosidade_relativa))
+        reynolds = np.asarray(reynolds, dtype=np.float64)
+        rugosidade_relativa = np.asarray(rugosidade_relativa, dtype=np.float64)
+        i, ti = self._celula(self.log_re, np.log10(np.maximum(reynolds, RE_LAMINAR)))
+        j, tj = self._celula(self.log_rugosidade, np.log10(np.maximum(rugosidade_relativa, RUGOSIDADE_MIN)))
+        # Índices planos: `take` num array 1-D é bem mais barato que indexação 2-D
+        log_f = self.log_f.ravel()
+        largura = self.log_f.shape[1]
+        canto = i * largura + j
+        abaixo = log_f.take(canto) + (log_f.take(canto + largura) - log_f.take(canto)) * ti
+        acima = log_f.take(canto + 1) + (log_f.take(canto + largura + 1) - log_f.take(canto + 1)) * ti
+        interpolado = abaixo + (acima - abaixo) * tj
+        with np.errstate(divide="ignore", invalid="ignore"):
+            laminar = np.where(reynolds > 0, 64.0 / reynolds, np.nan)
+        return np.where(reynolds >= RE_LAMINAR, 10 ** interpolado, laminar)
+
+    def _consultar_escalar(self, reynolds: float, rugosidade_relativa: float) -> float:
+        # Um ponto só: `math` evita o custo fixo das operações NumPy
+        if reynolds < RE_LAMINAR:
+            return 64.0 / reynolds if reynolds > 0 else math.nan
+        log_f = self._lista_log_f
+        pi = min(max((math.log10(reynolds) - self._origem[0]) / self._passo[0], 0.0), len(log_f) - 1)
+        pj = min(max((math.log10(max(rugosidade_relativa, RUGOSIDADE_MIN)) - self._origem[1]) / self._passo[1], 0.0),
+                 len(log_f[0]) - 1)
+        i, j = min(int(pi), len(log_f) - 2), min(int(pj), len(log_f[0]) - 2)
+        ti, tj = pi - i, pj - j
+        linha, seguinte = log_f[i], log_f[i + 1]
+        abaixo = linha[j] + (seguinte[j] - linha[j]) * ti
+        acima = linha[j + 1] + (seguinte[j + 1] - linha[j + 1]) * ti
+        return 10 ** (abaixo + (acima - abaixo) * tj)
+
+    @staticmethod
+    def _celula(nos: np.ndarray, valor: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Nós igualmente espaçados: o índice sai de uma divisão, sem busca
+        posicao = np.clip((valor - nos[0]) / (nos[1] - nos[0]), 0, len(nos) - 1)
+        indice = np.minimum(posicao.astype(np.intp), len(nos) - 2)
+        return indice, posicao - indice
+
+
+class DiagramaMoody:
+    """
+    Grade, especificação do gráfico e pontos de operação das questões,
+    compartilhados entre as sessões.
+    """
+
+    def __init__(self, grade: GradeMoody | None = None):
+        self.grade = grade or GradeMoody()
+        self._base: dict | None = None
+        self._pontos: dict[str, tuple[float, float, float] | None] = {}
+
+    def curvas(self, pontos: int = PONTOS_CURVA) -> list[dict]:
+        """
+        Pontos das curvas de ε/D constante (tirados da grade) e da reta laminar.
+        """
+        reynolds = np.geomspace(RE_LAMINAR, RE_MAX, pontos)
+        linhas = []
+        for rugosidade in CURVAS:
+            rotulo = "liso" if rugosidade == 0 else f"{rugosidade:g}"
+            f = self.grade.consultar(reynolds, rugosidade)
+            linhas += [{"Re": r, "f": v, "curva": rotulo} for r, v in zip(reynolds.tolist(), f.tolist())]
+            linhas[-1]["rotulo"] = True
+        linhas += [{"Re": r, "f": 64 / r, "curva": "laminar"} for r in np.geomspace(RE_MIN, RE_LAMINAR, 8).tolist()]
+        return linhas
+
+    def base(self) -> dict:
+        """
+        Especificação Vega-Lite das curvas, montada no primeiro uso. Não
+        deve ser alterada: `grafico` cria uma cópia rasa para cada ponto.
+        """
+        if self._base is None:
+            eixo_x = {"field": "Re", "type": "quantitative", "title": "Número de Reynolds, Re",
+                      "scale": {"type": "log", "domain": [RE_MIN, RE_MAX]}}
+            eixo_y = {"field": "f", "type": "quantitative", "title": "Fator de atrito, f",
+                      "scale": {"type": "log", "domain": [0.008, 0.1], "clamp": True}}
+            self._base = {
+                "title": "Diagrama de Moody",
+                "height": 420,
+                "data": {"values": self.curvas()},
+                "layer": [
+                    {
+                        "mark": {"type": "line", "strokeWidth": 1, "color": "#4c78a8"},
+                        "encoding": {"x": eixo_x, "y": eixo_y, "detail": {"field": "curva"},
+                                     "tooltip": [{"field": "curva", "title": "ε/D"}]},
+                    },
+                    {
+                        "transform": [{"filter": "datum.rotulo"}],
+                        "mark": {"type": "text", "align": "left", "dx": 4, "fontSize": 9},
+                        "encoding": {"x": eixo_x, "y": eixo_y, "text": {"field": "curva"}},
+                    },
+                ],
+            }
+        return self._base
+
+    def ponto_operacao(self, questao_id: str) -> tuple[float, float, float] | None:
+        """
+        (Re, ε/D, f) da questão com os dados do livro; None se ela não
+        tiver escoamento com atrito calculado por Colebrook.
+        """
+        if questao_id not in self._pontos:
+            from mecatutor.solucionadores import SOLUCIONADORES
+            solucionador = SOLUCIONADORES.get(questao_id)
+            ponto = solucionador.ponto_operacao() if solucionador is not None else None
+            if ponto is not None:
+                reynolds, rugosidade = (float(valor) for valor in ponto)
+                ponto = (reynolds, rugosidade, float(fator_atrito(reynolds, rugosidade)))
+            self._pontos.setdefault(questao_id, ponto)
+        return self._pontos[questao_id]
+
+    def grafico(self, ponto: tuple[float, float, float] | None = None) -> dict:
+        """
+        A especificação base, com o ponto de operação marcado se informado.
+        """
+        base = self.base()
+        if ponto is None:
+            return base
+        reynolds, rugosidade, f = ponto
+        marcador = {
+            "data": {"values": [{"Re": reynolds, "f": f, "rugosidade": rugosidade}]},
+            "mark": {"type": "point", "shape": "circle", "size": 120, "filled": True, "color": "#e45756"},
+            "encoding": {
+                "x": {"field": "Re", "type": "quantitative"},
+                "y": {"field": "f", "type": "quantitative"},
+                "tooltip": [
+                    {"field": "Re", "type": "quantitative", "format": ",.0f"},
+                    {"field": "rugosidade", "type": "quantitative", "title": "ε/D", "format": ".3~g"},
+                    {"field": "f", "type": "quantitative", "format": ".4f"},
+                ],
+            },
+        }
+        return {**base, "layer": [*base["layer"], marcador]}
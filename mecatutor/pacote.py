@@ -0,0 +1,109 @@
+"""
+Pacote binário de conteúdo para a versão empacotada (PyInstaller).
+
+O pacote reúne resumos, questões, tabelas e o manifesto de imagens em um
+único arquivo versionado. Formato:
+
+    cabeçalho  : "MTPK" | versão do formato (u16) | tamanho do índice (u32)
+    índice     : JSON {"versao": hash do conteúdo, "itens": {chave: [offset, tamanho]}}
+    dados      : itens JSON comprimidos com zlib, um após o outro
+
+Na leitura o arquivo é mapeado em memória e só o índice é decodificado; cada
+item é descomprimido apenas quando pedido, então a memória do processo só
+cresce com o conteúdo efetivamente visualizado.
+
+Gerar o pacote antes do build:
+
+    python -m mecatutor.pacote conteudo.pak
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import struct
+import sys
+import zlib
+from typing import Any, Iterable
+
+from mecatutor import fontes
+
+MAGICO = b"MTPK"
+VERSAO_FORMATO = 1
+_CABECALHO = struct.Struct("<4sHI")
+
+
+def compilar(destino: str, chaves: Iterable[str] | None = None) -> str:
+    """
+    Compila o conteúdo das fontes em `destino` e retorna a versão gerada.
+    """
+    itens: dict[str, list[int]] = {}
+    blocos: list[bytes] = []
+    hash_conteudo = hashlib.sha256()
+    offset = 0
+    for chave in chaves if chaves is not None else fontes.chaves():
+        bruto = json.dumps(fontes.ler(chave), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        hash_conteudo.update(chave.encode("utf-8") + b"\0" + bruto)
+        bloco = zlib.compress(bruto, 9)
+        itens[chave] = [offset, len(bloco)]
+        blocos.append(bloco)
+        offset += len(bloco)
+
+    versao = hash_conteudo.hexdigest()[:16]
+    indice = json.dumps({"versao": versao, "itens": itens}, separators=(",", ":")).encode("utf-8")
+    with open(destino, "wb") as arquivo:
+        arquivo.write(_CABECALHO.pack(MAGICO, VERSAO_FORMATO, len(indice)))
+        arquivo.write(indice)
+        for bloco in blocos:
+            arquivo.write(bloco)
+    return versao
+
+
+class Pacote:
+    """
+    Leitor do pacote mapeado em memória, com decodificação sob demanda.
+    """
+
+    def __init__(self, caminho: str):
+        with open(caminho, "rb") as arquivo:
+            self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        magico, versao_formato, tamanho_indice = _CABECALHO.unpack_from(self._mapa, 0)
+        if magico != MAGICO:
+            raise ValueError(f"{caminho} não é um pacote de conteúdo")
+        if versao_formato != VERSAO_FORMATO:
+            raise ValueError(f"Versão de pacote {versao_formato} não suportada (esperado {VERSAO_FORMATO})")
+        inicio_indice = _CABECALHO.size
+        indice = json.loads(self._mapa[inicio_indice:inicio_indice + tamanho_indice])
+        self.versao: str = indice["versao"]
+        self._itens: dict[str, list[int]] = indice["itens"]
+        self._inicio_dados = inicio_indice + tamanho_indice
+
+    def __contains__(self, chave: object) -> bool:
+        return chave in self._itens
+
+    def chaves(self) -> list[str]:
+        return list(self._itens)
+
+    def ler(self, chave: str) -> Any:
+        """
+        Decodifica um único item. Levanta KeyError se a chave não existir.
+        """
+        offset, tamanho = self._itens[chave]
+        inicio = self._inicio_dados + offset
+        return json.loads(zlib.decompress(self._mapa[inicio:inicio + tamanho]))
+
+    def fechar(self) -> None:
+        self._mapa.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    destino = argv[0] if argv else "conteudo.pak"
+    versao = compilar(destino)
+    print(f"Pacote {destino} gerado (versão {versao}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
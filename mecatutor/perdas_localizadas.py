@@ -0,0 +1,183 @@
+"""
+Perdas localizadas (Seção 8.4): catálogo de K_L e perda total de sistemas.
+
+O catálogo (Tabela 8.2) guarda os coeficientes num vetor float64
+indexado pelo nome do componente. Um sistema é uma sequência de trechos
+de tubo, cada um com os seus componentes; `Sistema.compilar` reduz a
+descrição a arrays por trecho (L, D, ε e ΣK, este somado por
+`np.bincount` sobre os índices dos componentes) e guarda o resultado,
+então avaliar a perda total
+
+    h_L = Σ (f L/D + ΣK) V²/(2g)
+
+para muitas vazões custa uma chamada vetorizada a
+`tubulacoes.perda_carga` sobre (vazões × trechos), sem voltar à
+descrição; o atrito é o mesmo de `tubulacoes` e `redes`.
+
+    >>> from mecatutor.tabelas import TABELAS
+    >>> catalogo = CatalogoAcessorios.de_dicionario("8.2", TABELAS["8.2"])
+    >>> sistema = Sistema(catalogo)
+    >>> sistema.trecho(100, 0.1, rugosidade=4.5e-5, acessorios={
+    ...     "Entrada em aresta viva": 1, "Cotovelo 90° flangeado, raio normal": 2, "Saída": 1})
+    >>> sistema.compilar().soma_k
+    array([2.1])
+    >>> round(float(sistema.perda_carga(0.01)), 3)
+    1.785
+
+`catalogo.soma_k(...)` dá o ΣK de um tubo isolado para o argumento
+`soma_k` de `tubulacoes` e de `redes.Rede.tubo`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterable, Mapping
+
+import numpy as np
+
+from mecatutor.tubulacoes import NU_AGUA, perda_carga
+
+# Tabela do livro com os coeficientes K_L
+TABELA_ACESSORIOS = "8.2"
+
+
+@dataclass(frozen=True)
+class CatalogoAcessorios:
+    """
+    Componentes e seus K_L, somente leitura.
+    """
+    id: str
+    titulo: str
+    rotulo_componente: str
+    rotulo_k: str
+    componentes: tuple[str, ...]
+    k: np.ndarray
+
+    @classmethod
+    def de_dicionario(cls, tabela_id: str, tabela: Mapping) -> "CatalogoAcessorios":
+        dados = tabela["dados"]
+        rotulo_componente, rotulo_k = dados
+        k = np.array(dados[rotulo_k], dtype=np.float64)
+        k.setflags(write=False)
+        return cls(
+            id=tabela_id,
+            titulo=tabela["titulo"],
+            rotulo_componente=rotulo_componente,
+            rotulo_k=rotulo_k,
+            componentes=tuple(dados[rotulo_componente]),
+            k=k,
+        )
+
+    @cached_property
+    def _indice(self) -> dict[str, int]:
+        return {componente: i for i, componente in enumerate(self.componentes)}
+
+    @cached_property
+    def dataframe(self):
+        """
+        DataFrame para exibição, montado uma única vez a partir dos arrays.
+        """
+        import pandas as pd
+
+        return pd.DataFrame({self.rotulo_componente: self.componentes, self.rotulo_k: self.k})
+
+    def indices(self, componentes: Iterable[str]) -> np.ndarray:
+        try:
+            return np.fromiter((self._indice[componente] for componente in componentes), dtype=np.intp)
+        except KeyError as erro:
+            raise KeyError(f"Sem K_L para o componente {erro.args[0]!r}") from None
+
+    def soma_k(self, acessorios: Mapping[str, float] | Iterable[str]) -> float:
+        """
+        ΣK de `acessorios`: nome -> quantidade, ou uma lista de nomes
+        (repetidos quantas vezes o componente aparece).
+        """
+        indices, quantidades = self._separar(acessorios)
+        return float(self.k[indices] @ quantidades)
+
+    def _separar(self, acessorios: Mapping[str, float] | Iterable[str]) -> tuple[np.ndarray, np.ndarray]:
+        if isinstance(acessorios, Mapping):
+            return self.indices(acessorios), np.fromiter(acessorios.values(), dtype=np.float64, count=len(acessorios))
+        indices = self.indices(acessorios)
+        return indices, np.ones(len(indices))
+
+
+@dataclass(frozen=True)
+class SistemaCompilado:
+    """
+    Arrays por trecho de um sistema, prontos para avaliar a perda de carga.
+    """
+    comprimento: np.ndarray
+    diametro: np.ndarray
+    rugosidade: np.ndarray
+    soma_k: np.ndarray
+
+    def perdas(self, q, nu: float = NU_AGUA) -> np.ndarray:
+        """
+        Perda de carga (m) de cada trecho, com o sinal da vazão: forma
+        q.shape + (trechos,).
+        """
+        q = np.asarray(q, dtype=np.float64)[..., np.newaxis]
+        return perda_carga(q, self.diametro, self.comprimento, self.rugosidade, nu, self.soma_k)
+
+    def perda_carga(self, q, nu: float = NU_AGUA):
+        """
+        Perda de carga total (m) para cada vazão `q` (m³/s).
+        """
+        total = self.perdas(q, nu).sum(axis=-1)
+        return float(total) if total.ndim == 0 else total
+
+
+class Sistema:
+    """
+    Trechos de tubo em série e os componentes de cada um.
+    """
+
+    def __init__(self, catalogo: CatalogoAcessorios):
+        self.catalogo = catalogo
+        self._trechos: list[tuple[float, float, float, float]] = []  # (L, D, ε, ΣK fora do catálogo)
+        # Componentes de todos os trechos, em listas planas
+        self._trecho_componente: list[int] = []
+        self._indice_componente: list[int] = []
+        self._quantidade: list[float] = []
+        self._compilado: SistemaCompilado | None = None
+
+    def trecho(
+        self, comprimento: float, diametro: float, rugosidade: float = 0.0,
+        acessorios: Mapping[str, float] | Iterable[str] = (), soma_k: float = 0.0,
+    ) -> None:
+        """
+        Acrescenta um trecho com os seus componentes (ver
+        `CatalogoAcessorios.soma_k`) e um ΣK adicional para perdas fora do
+        catálogo. Levanta KeyError para componente desconhecido.
+        """
+        indices, quantidades = self.catalogo._separar(acessorios)
+        self._trecho_componente.extend([len(self._trechos)] * len(indices))
+        self._indice_componente.extend(indices.tolist())
+        self._quantidade.extend(quantidades.tolist())
+        self._trechos.append((float(comprimento), float(diametro), float(rugosidade), float(soma_k)))
+        self._compilado = None
+
+    def compilar(self) -> SistemaCompilado:
+        """
+        Reduz a descrição a arrays por trecho; o resultado fica guardado até
+        o próximo `trecho`.
+        """
+        if self._compilado is None:
+            comprimento, diametro, rugosidade, soma_k = np.array(self._trechos, dtype=np.float64).reshape(-1, 4).T
+            k = self.catalogo.k[np.array(self._indice_componente, dtype=np.intp)]
+            soma_k = soma_k + np.bincount(
+                np.array(self._trecho_componente, dtype=np.intp),
+                weights=k * np.array(self._quantidade, dtype=np.float64), minlength=len(self._trechos),
+            )
+            self._compilado = SistemaCompilado(
+                comprimento=comprimento, diametro=diametro, rugosidade=rugosidade, soma_k=soma_k,
+            )
+        return self._compilado
+
+    def perda_carga(self, q, nu: float = NU_AGUA):
+        """
+        Perda de carga total (m) do sistema para a vazão `q` (escalar ou array).
+        """
+        return self.compilar().perda_carga(q, nu)
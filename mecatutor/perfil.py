@@ -0,0 +1,106 @@
+"""
+Relatório do tempo de importação na inicialização do app.
+
+Executa, em um interpretador novo com `-X importtime`, exatamente as
+importações de nível de módulo do app.py e resume o resultado por pacote,
+listando também quais dependências pesadas ficaram de fora (importadas só
+nas páginas que as usam).
+
+    python app.py --profile-startup
+    python -m mecatutor.perfil [app.py] [--top N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+# Dependências que não devem ser carregadas na inicialização
+PESADAS = ("pandas", "numpy", "PIL", "latex2mathml", "pyarrow", "altair")
+
+_LINHA = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def importacoes_de_inicializacao(caminho_app: str) -> list[str]:
+    """
+    Módulos importados no nível de módulo do script (fora de funções).
+    """
+    arvore = ast.parse(Path(caminho_app).read_text(encoding="utf-8"))
+    modulos = []
+    for no in arvore.body:
+        if isinstance(no, ast.Import):
+            modulos.extend(alias.name for alias in no.names)
+        elif isinstance(no, ast.ImportFrom) and no.module and not no.level:
+            modulos.append(no.module)
+    return list(dict.fromkeys(modulos))
+
+
+def medir(modulos: list[str], diretorio: str) -> tuple[list[tuple[str, int, int, int]], float]:
+    """
+    Importa `modulos` em um subprocesso e retorna as linhas do importtime
+    (módulo, self µs, acumulado µs, profundidade) e o tempo total em segundos.
+    """
+    codigo = "; ".join(f"import {modulo}" for modulo in modulos)
+    inicio = time.perf_counter()
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo],
+        cwd=diretorio, capture_output=True, text=True, check=True,
+    )
+    total = time.perf_counter() - inicio
+    linhas = []
+    for linha in processo.stderr.splitlines():
+        correspondencia = _LINHA.match(linha)
+        if correspondencia:
+            proprio, acumulado, indentacao, nome = correspondencia.groups()
+            linhas.append((nome, int(proprio), int(acumulado), len(indentacao) // 2))
+    return linhas, total
+
+
+def relatorio(caminho_app: str, top: int = 15) -> str:
+    modulos = importacoes_de_inicializacao(caminho_app)
+    linhas, total = medir(modulos, str(Path(caminho_app).resolve().parent))
+
+    por_pacote: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+    for nome, proprio, _, _ in linhas:
+        pacote = por_pacote[nome.split(".")[0]]
+        pacote[0] += proprio
+        pacote[1] += 1
+    soma = sum(proprio for _, proprio, _, _ in linhas)
+    carregados = {nome.split(".")[0] for nome, *_ in linhas}
+
+    saida = [
+        f"Importações de inicialização de {caminho_app}: {', '.join(modulos)}",
+        f"Tempo total do processo: {total * 1000:.0f} ms; importações: {soma / 1000:.0f} ms em {len(linhas)} módulos",
+        "",
+        f"{'pacote':<28}{'ms':>9}{'%':>7}{'módulos':>9}",
+    ]
+    for pacote, (proprio, quantidade) in sorted(por_pacote.items(), key=lambda item: -item[1][0])[:top]:
+        saida.append(f"{pacote:<28}{proprio / 1000:>9.1f}{100 * proprio / max(soma, 1):>7.1f}{quantidade:>9}")
+
+    saida += ["", f"{'módulos mais lentos (acumulado)':<44}{'ms':>9}"]
+    for nome, _, acumulado, _ in sorted(linhas, key=lambda linha: -linha[2])[:top]:
+        saida.append(f"{nome:<44}{acumulado / 1000:>9.1f}")
+
+    saida += ["", "Dependências pesadas na inicialização:"]
+    for pacote in PESADAS:
+        saida.append(f"  {pacote:<14}{'CARREGADO' if pacote in carregados else 'adiado'}")
+    return "\n".join(saida)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("app", nargs="?", default=str(Path(__file__).resolve().parent.parent / "app.py"))
+    parser.add_argument("--top", type=int, default=15)
+    argumentos = parser.parse_args(argv)
+    print(relatorio(argumentos.app, argumentos.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
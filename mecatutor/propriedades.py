@@ -0,0 +1,139 @@
+"""
+Tabelas de propriedades de fluidos (Tabelas 1.5 e 1.6) em formato colunar.
+
+As tabelas são carregadas uma vez por processo e guardadas como matrizes
+float64 com colunas contíguas, indexadas pelo nome do fluido:
+
+    >>> from mecatutor.conteudo import Conteudo
+    >>> armazem = Conteudo.abrir().propriedades()
+    >>> armazem.props("Água", ["rho", "mu"])
+    array([9.99e+02, 1.12e-03])
+
+Os mesmos arrays alimentam o `st.dataframe` dos resumos e os solucionadores.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterable, Mapping, Sequence
+
+import numpy as np
+
+# Tabelas do livro que contêm propriedades de fluidos
+TABELAS_PROPRIEDADES = ("1.5", "1.6")
+
+# Rótulo da coluna na tabela -> nome curto da grandeza
+GRANDEZAS = {
+    "Temperatura (°C)": "T",
+    "Massa Específica (kg/m³)": "rho",
+    "Viscosidade Dinâmica μ (N·s/m²)": "mu",
+    "Tensão Superficial σ (N/m)": "sigma",
+    "Pressão de Vapor p_v (N/m² abs)": "pv",
+    "Compressibilidade E_s (N/m²)": "Es",
+    "Constante do Gás R (J/kg·K)": "R",
+    "Razão de Calores Específicos k": "k",
+}
+
+
+@dataclass(frozen=True)
+class TabelaPropriedades:
+    """
+    Uma tabela do livro: nomes dos fluidos e matriz (fluido x grandeza).
+    """
+    id: str
+    titulo: str
+    rotulo_fluido: str
+    fluidos: tuple[str, ...]
+    rotulos: tuple[str, ...]
+    grandezas: tuple[str, ...]
+    valores: np.ndarray
+
+    @classmethod
+    def de_dicionario(cls, tabela_id: str, tabela: Mapping) -> "TabelaPropriedades":
+        dados = tabela["dados"]
+        rotulo_fluido, *rotulos = dados
+        valores = np.asfortranarray([dados[rotulo] for rotulo in rotulos], dtype=np.float64).T
+        valores.setflags(write=False)
+        return cls(
+            id=tabela_id,
+            titulo=tabela["titulo"],
+            rotulo_fluido=rotulo_fluido,
+            fluidos=tuple(dados[rotulo_fluido]),
+            rotulos=tuple(rotulos),
+            grandezas=tuple(GRANDEZAS[rotulo] for rotulo in rotulos),
+            valores=valores,
+        )
+
+    @cached_property
+    def dataframe(self):
+        """
+        DataFrame para exibição, montado uma única vez a partir dos arrays.
+        """
+        import pandas as pd
+
+        colunas = {self.rotulo_fluido: self.fluidos}
+        colunas.update((rotulo, self.valores[:, j]) for j, rotulo in enumerate(self.rotulos))
+        return pd.DataFrame(colunas)
+
+
+class ArmazemPropriedades:
+    """
+    Todas as tabelas de propriedades em uma única matriz colunar
+    (fluido x grandeza), com NaN onde a grandeza não se aplica ao fluido.
+    """
+
+    def __init__(self, tabelas: Iterable[TabelaPropriedades]):
+        self._tabelas = {tabela.id: tabela for tabela in tabelas}
+        fluidos: list[str] = []
+        grandezas: list[str] = []
+        for tabela in self._tabelas.values():
+            fluidos.extend(tabela.fluidos)
+            grandezas.extend(g for g in tabela.grandezas if g not in grandezas)
+
+        self.fluidos = tuple(fluidos)
+        self.grandezas = tuple(grandezas)
+        self._linha = {fluido: i for i, fluido in enumerate(self.fluidos)}
+        self._coluna = {grandeza: j for j, grandeza in enumerate(self.grandezas)}
+
+        valores = np.full((len(self.fluidos), len(self.grandezas)), np.nan, order="F")
+        for tabela in self._tabelas.values():
+            linhas = [self._linha[fluido] for fluido in tabela.fluidos]
+            colunas = [self._coluna[grandeza] for grandeza in tabela.grandezas]
+            valores[np.ix_(linhas, colunas)] = tabela.valores
+        valores.setflags(write=False)
+        self.valores = valores
+
+    @classmethod
+    def de_conteudo(cls, ler_tabela) -> "ArmazemPropriedades":
+        return cls(TabelaPropriedades.de_dicionario(tid, ler_tabela(tid)) for tid in TABELAS_PROPRIEDADES)
+
+    def tabela(self, tabela_id: str) -> TabelaPropriedades:
+        return self._tabelas[tabela_id]
+
+    def coluna(self, grandeza: str) -> np.ndarray:
+        """
+        Vista (somente leitura) de uma grandeza para todos os fluidos.
+        """
+        return self.valores[:, self._indices(self._coluna, grandeza, "a grandeza")]
+
+    def props(self, fluido: str | Sequence[str], grandezas: str | Sequence[str]):
+        """
+        Consulta vetorizada. Escalares retornam float; listas retornam
+        arrays (1-D se apenas um dos argumentos for lista, 2-D se ambos).
+        """
+        linhas = self._indices(self._linha, fluido, "o fluido")
+        colunas = self._indices(self._coluna, grandezas, "a grandeza")
+        if isinstance(linhas, np.ndarray) and isinstance(colunas, np.ndarray):
+            return self.valores[np.ix_(linhas, colunas)]
+        resultado = self.valores[linhas, colunas]
+        return float(resultado) if np.ndim(resultado) == 0 else resultado
+
+    @staticmethod
+    def _indices(indice: Mapping[str, int], chaves: str | Sequence[str], tipo: str):
+        try:
+            if isinstance(chaves, str):
+                return indice[chaves]
+            return np.fromiter((indice[chave] for chave in chaves), dtype=np.intp)
+        except KeyError as erro:
+            raise KeyError(f"Sem dados para {tipo} {erro.args[0]!r}") from None
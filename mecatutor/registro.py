@@ -0,0 +1,98 @@
+"""
+Registro de resumos dos capítulos, carregados sob demanda.
+
+O registro é compartilhado por todas as sessões; apenas os resumos mais
+recentemente usados ficam em memória (LRU limitado), de forma que o número
+de capítulos não afeta o tempo de importação nem o consumo de memória.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+# Marcadores usados nos resumos para posicionar uma tabela ou um gráfico:
+# <!-- tabela:1.5 -->, <!-- grafico:moody -->
+MARCADOR_BLOCO = re.compile(r"^<!-- (tabela|grafico):(\S+) -->$", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class Resumo:
+    """
+    Resumo de um capítulo, como blocos ("markdown", texto), ("tabela", id
+    da tabela) ou ("grafico", nome do gráfico) na ordem de exibição.
+    """
+    capitulo: int
+    titulo: str
+    blocos: tuple[tuple[str, str], ...]
+
+
+def dividir_blocos(texto: str) -> tuple[tuple[str, str], ...]:
+    blocos: list[tuple[str, str]] = []
+    inicio = 0
+    for marcador in MARCADOR_BLOCO.finditer(texto):
+        if texto[inicio:marcador.start()].strip():
+            blocos.append(("markdown", texto[inicio:marcador.start()]))
+        blocos.append((marcador.group(1), marcador.group(2)))
+        inicio = marcador.end()
+    if texto[inicio:].strip():
+        blocos.append(("markdown", texto[inicio:]))
+    return tuple(blocos)
+
+
+class RegistroResumos:
+    """
+    Carrega resumos por id de capítulo, mantendo no máximo `capacidade`
+    resumos em memória.
+    """
+
+    def __init__(self, ler: Callable[[str], Any], capacidade: int = 4):
+        if capacidade < 1:
+            raise ValueError("capacidade deve ser pelo menos 1")
+        self._ler = ler
+        self.capacidade = capacidade
+        self._cache: OrderedDict[int, Resumo] = OrderedDict()
+        self._trava = threading.Lock()
+        self._capitulos: dict[int, tuple[str, str]] | None = None
+        self.acertos = 0
+        self.falhas = 0
+
+    def capitulos(self) -> dict[int, tuple[str, str]]:
+        """
+        Capítulos com resumo: id -> (rótulo do menu, título da página).
+        """
+        if self._capitulos is None:
+            self._capitulos = {int(cap): tuple(titulos) for cap, titulos in self._ler("capitulos").items()}
+        return self._capitulos
+
+    def get(self, capitulo: int) -> Resumo:
+        with self._trava:
+            resumo = self._cache.get(capitulo)
+            if resumo is not None:
+                self._cache.move_to_end(capitulo)
+                self.acertos += 1
+                return resumo
+            self.falhas += 1
+
+        # A leitura fica fora da trava para não serializar as sessões
+        titulo = self.capitulos()[capitulo][1]
+        resumo = Resumo(capitulo, titulo, dividir_blocos(self._ler(f"resumo/{capitulo}")))
+
+        with self._trava:
+            self._cache[capitulo] = resumo
+            self._cache.move_to_end(capitulo)
+            while len(self._cache) > self.capacidade:
+                self._cache.popitem(last=False)
+        return resumo
+
+    def estatisticas(self) -> dict[str, int]:
+        with self._trava:
+            return {
+                "acertos": self.acertos,
+                "falhas": self.falhas,
+                "em_cache": len(self._cache),
+                "capacidade": self.capacidade,
+            }
@@ -0,0 +1,305 @@
+"""
+Solucionadores executáveis do gabarito.
+
+Cada questão numérica pode ter uma função que recalcula a resposta a partir
+dos dados do enunciado, registrada com `@solucionador(id, **dados)`. A
+função recebe um dicionário de parâmetros e usa só operações NumPy, então
+aceita escalares ou arrays (várias variantes de uma vez). Retorna o valor
+na unidade da questão ou um dicionário subitem -> valor.
+
+    >>> round(SOLUCIONADORES["2.27"].resolver(), 4)
+    0.1917
+    >>> SOLUCIONADORES["2.27"].resolver(p_ar=np.array([13.8e3, 20e3])).round(4)
+    array([0.1917, 0.2381])
+
+`python -m mecatutor.verificacao` confere todos contra o banco.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Mapping
+
+import numpy as np
+
+from mecatutor.atrito import fator_atrito
+from mecatutor.tubulacoes import G, NU_AGUA, area_circular, diametro
+
+GAMMA_AGUA = 9810.0  # N/m³
+PSI = 6895.0  # Pa
+
+
+@dataclass(frozen=True)
+class Solucionador:
+    questao: str
+    funcao: Callable[[Mapping[str, Any]], Any]
+    dados: Mapping[str, float] = field(default_factory=dict)
+    # (Re, ε/D) do escoamento, nas questões que usam o fator de atrito
+    operacao: Callable[[Mapping[str, Any]], tuple] | None = None
+
+    def resolver(self, parametros: Mapping[str, Any] | None = None, **alteracoes):
+        """
+        Resolve com os dados do enunciado, trocando os que forem informados.
+        """
+        return self.funcao({**self.dados, **(parametros or {}), **alteracoes})
+
+    def ponto_operacao(self, parametros: Mapping[str, Any] | None = None, **alteracoes):
+        """
+        (Re, ε/D) com os mesmos parâmetros de `resolver`; None se não houver.
+        """
+        if self.operacao is None:
+            return None
+        return self.operacao({**self.dados, **(parametros or {}), **alteracoes})
+
+
+SOLUCIONADORES: dict[str, Solucionador] = {}
+
+
+def solucionador(questao_id: str, **dados: float):
+    def registrar(funcao):
+        SOLUCIONADORES[questao_id] = Solucionador(questao_id, funcao, dados)
+        return funcao
+    return registrar
+
+
+def ponto_operacao(questao_id: str):
+    """
+    Registra a função (Re, ε/D) de uma questão já registrada.
+    """
+    def registrar(funcao):
+        SOLUCIONADORES[questao_id] = replace(SOLUCIONADORES[questao_id], operacao=funcao)
+        return funcao
+    return registrar
+
+
+# Capítulo 2 ---------------------------------------------------------------
+
+@solucionador("2.18", p_atm=101e3, rho_hg=13600, rho_agua=999, rho_alcool=789,
+              pv_hg=0.16, pv_agua=1777, pv_alcool=5900)
+def _2_18(p):
+    # Diferença entre as alturas sem e com pressão de vapor: pv / (rho g)
+    return {
+        "a": p["pv_hg"] / (p["rho_hg"] * G),
+        "b": p["pv_agua"] / (p["rho_agua"] * G),
+        "c": p["pv_alcool"] / (p["rho_alcool"] * G),
+    }
+
+
+@solucionador("2.24", p_ar=110.0, p_atm=101.0, gamma_agua=9.81, h_agua=0.61, gamma_m=14.14, h=1.219)
+def _2_24(p):
+    return p["p_ar"] - p["p_atm"] + p["gamma_agua"] * p["h_agua"] + p["gamma_m"] * p["h"]
+
+
+@solucionador("2.26", p_a_menos_p_b=20e3, sg_a=1.2, rho_b=1500)
+def _2_26(p):
+    gamma_a = p["sg_a"] * GAMMA_AGUA
+    gamma_b = p["rho_b"] * G
+    return (2 * gamma_a - 2 * gamma_b + p["p_a_menos_p_b"]) / 2
+
+
+@solucionador("2.27", p_ar=13.8e3, h_agua=1.2, sg_hg=13.6)
+def _2_27(p):
+    return (p["p_ar"] + GAMMA_AGUA * p["h_agua"]) / (p["sg_hg"] * GAMMA_AGUA)
+
+
+@solucionador("2.32", p_a_psi=0.6, sg_m=2.6, l=0.203, angulo=30.0)
+def _2_32(p):
+    p_b = p["p_a_psi"] * PSI - p["sg_m"] * GAMMA_AGUA * p["l"] * np.sin(np.radians(p["angulo"]))
+    return p_b / 1000
+
+
+@solucionador("2.35", p_vapor=120e3, p_atm=101e3, rho=800, sg_hg=13.6)
+def _2_35(p):
+    gamma = p["rho"] * G
+    return {
+        "a": (p["p_vapor"] + gamma * 1.0 - p["p_atm"]) / 1000,
+        "b": (p["p_vapor"] + gamma * 2.0 - p["p_atm"]) / (p["sg_hg"] * GAMMA_AGUA),
+    }
+
+
+@solucionador("2.41", d_pistao=0.152, gamma_oleo=9.27e3, l=0.152, angulo=30.0)
+def _2_41(p):
+    return area_circular(p["d_pistao"]) * p["gamma_oleo"] * p["l"] * np.sin(np.radians(p["angulo"]))
+
+
+@solucionador("2.43", delta_p=3.5e3, a=0.0254, sg_oleo=0.8, sg_hg=13.6)
+def _2_43(p):
+    gamma_hg = p["sg_hg"] * GAMMA_AGUA
+    b = (p["delta_p"] - p["a"] * (gamma_hg - p["sg_oleo"] * GAMMA_AGUA)) / (gamma_hg - GAMMA_AGUA)
+    return p["a"] / b
+
+
+@solucionador("2.44", delta_p=700.0, l=0.305, rho_ccl4=1590, sg_salina=1.1)
+def _2_44(p):
+    diferenca = p["rho_ccl4"] * G - p["sg_salina"] * GAMMA_AGUA
+    return np.degrees(np.arcsin(p["delta_p"] / (p["l"] * diferenca)))
+
+
+@solucionador("2.46", delta_p=34.5e3, d1=0.0127, d2=0.0064, sg_oleo=0.9, sg_hg=13.6, angulo=30.0)
+def _2_46(p):
+    gamma_hg = p["sg_hg"] * GAMMA_AGUA
+    razao = (p["d1"] / p["d2"]) ** 2
+    coeficiente = (gamma_hg - GAMMA_AGUA) + razao * np.sin(np.radians(p["angulo"])) * (gamma_hg + p["sg_oleo"] * GAMMA_AGUA)
+    return p["delta_p"] / coeficiente
+
+
+# Capítulo 3 ---------------------------------------------------------------
+
+@solucionador("3.14", v_terreo=6.1, andar=3.6)
+def _3_14(p):
+    v2 = p["v_terreo"] ** 2
+    return {
+        "subsolo": np.sqrt(v2 + 2 * G * p["andar"]),
+        "primeiro": np.sqrt(np.maximum(v2 - 2 * G * p["andar"], 0)),
+    }
+
+
+@solucionador("3.19", d=0.019, h=0.071)
+def _3_19(p):
+    return area_circular(p["d"]) * np.sqrt(2 * G * p["h"])
+
+
+@solucionador("3.25", d1=0.037, d3=0.031, z3=0.92, z2=0.61)
+def _3_25(p):
+    v3 = np.sqrt(2 * G * p["z3"] / (1 - (p["d3"] / p["d1"]) ** 4))
+    return {"Q": area_circular(p["d3"]) * v3, "P2": -p["z2"] * GAMMA_AGUA}
+
+
+@solucionador("3.34", p1=172e3, z1=2.44, z_a=6.10)
+def _3_34(p):
+    return p["p1"] / GAMMA_AGUA + p["z1"] - p["z_a"]
+
+
+@solucionador("3.43", d=0.015, desnivel=0.43)
+def _3_43(p):
+    return area_circular(p["d"]) * np.sqrt(2 * G * p["desnivel"])
+
+
+@solucionador("3.51", h1=0.04, h2=0.06, largura=0.06, altura1=0.04, altura2=0.02, gamma_ar=12.02)
+def _3_51(p):
+    delta_p = GAMMA_AGUA * (p["h1"] + p["h2"])
+    a1, a2 = p["altura1"] * p["largura"], p["altura2"] * p["largura"]
+    v1 = np.sqrt(2 * G * delta_p / p["gamma_ar"] / ((a1 / a2) ** 2 - 1))
+    return {"Q": a1 * v1, "h2": p["h2"], "P1": GAMMA_AGUA * p["h1"]}
+
+
+@solucionador("3.58", h_b=2.0, d_a=0.03, d_b=0.05)
+def _3_58(p):
+    return p["h_b"] * (p["d_b"] / p["d_a"]) ** 4
+
+
+@solucionador("3.68", v2=4.6, d2=0.152, d1=0.102, carga_p2=1.829, l=0.203, angulo=20.0)
+def _3_68(p):
+    v1 = p["v2"] * (p["d2"] / p["d1"]) ** 2
+    z2 = p["l"] * np.sin(np.radians(p["angulo"]))
+    return v1 ** 2 / (2 * G) - (p["carga_p2"] + p["v2"] ** 2 / (2 * G) + z2)
+
+
+@solucionador("3.73", p1=735e3, p2=550e3, d1=0.031, d2=0.019, gamma=9.1e3)
+def _3_73(p):
+    carga = (p["p1"] - p["p2"]) / p["gamma"]
+    v2 = np.sqrt(2 * G * carga / (1 - (p["d2"] / p["d1"]) ** 4))
+    return area_circular(p["d2"]) * v2
+
+
+# Capítulo 8 ---------------------------------------------------------------
+
+@solucionador("8.46", d=0.0127, furos=50, d_furo=0.0013)
+def _8_46(p):
+    razao = p["d"] ** 2 / (p["furos"] * p["d_furo"] ** 2)
+    return 3 * (razao ** 2 - 1)
+
+
+@solucionador("8.71", q=5.68e-5, d=0.0127, rho=1000.0, mu=1.567e-3, rugosidade=1.5e-6,
+              trechos=5, l_trecho=0.46, curvas=4, k_curva=1.5)
+def _8_71(p):
+    v = p["q"] / area_circular(p["d"])
+    f = fator_atrito(p["rho"] * v * p["d"] / p["mu"], p["rugosidade"] / p["d"])
+    h_l = (f * p["trechos"] * p["l_trecho"] / p["d"] + p["curvas"] * p["k_curva"]) * v ** 2 / (2 * G)
+    return p["rho"] * G * h_l
+
+
+@ponto_operacao("8.71")
+def _8_71_operacao(p):
+    v = p["q"] / area_circular(p["d"])
+    return p["rho"] * v * p["d"] / p["mu"], p["rugosidade"] / p["d"]
+
+
+@solucionador("8.73", p1=13.8e5, q=2.83e-4, d=0.0127, d_bocal=0.0076, z2=3.05, f=0.022)
+def _8_73(p):
+    v1 = p["q"] / area_circular(p["d"])
+    v2 = p["q"] / area_circular(p["d_bocal"])
+    sobra = p["p1"] / GAMMA_AGUA + v1 ** 2 / (2 * G) - v2 ** 2 / (2 * G) - p["z2"]
+    return sobra / (p["f"] / p["d"] * v1 ** 2 / (2 * G))
+
+
+@solucionador("8.83", q=1.42e-2, nu=NU_AGUA)
+def _8_83(p):
+    # Sem variação de pressão num tubo vertical: h_L = l (tubo liso, problema do tipo III)
+    return diametro(p["q"], 1.0, 1.0, 0.0, p["nu"])
+
+
+@ponto_operacao("8.83")
+def _8_83_operacao(p):
+    d = _8_83(p)
+    return 4 * p["q"] / (np.pi * d * p["nu"]), np.zeros_like(d)
+
+
+@solucionador("8.86", v=4.6, d=0.051, rugosidade_relativa=0.004, l=2.44, z2=2.44, k_descarga=1.0, nu=NU_AGUA)
+def _8_86(p):
+    f = fator_atrito(p["v"] * p["d"] / p["nu"], p["rugosidade_relativa"])
+    return p["z2"] + (f * p["l"] / p["d"] + p["k_descarga"]) * p["v"] ** 2 / (2 * G)
+
+
+@ponto_operacao("8.86")
+def _8_86_operacao(p):
+    return p["v"] * p["d"] / p["nu"], p["rugosidade_relativa"]
+
+
+@solucionador("8.95", q=0.006, queda=4.0, l=7.0, aspecto=1.7, rugosidade=0.00015, nu=NU_AGUA)
+def _8_95(p):
+    def queda_necessaria(h):
+        area = p["aspecto"] * h ** 2
+        d_h = 4 * area / (2 * (p["aspecto"] * h + h))
+        v = p["q"] / area
+        f = fator_atrito(v * d_h / p["nu"], p["rugosidade"] / d_h)
+        return v ** 2 / (2 * G) * (1 + f * p["l"] / d_h)
+
+    # Bissecção vetorizada: a queda necessária diminui com h
+    baixo = np.full(np.shape(p["q"]), 1e-3)
+    alto = np.full(np.shape(p["q"]), 1.0)
+    for _ in range(60):
+        meio = (baixo + alto) / 2
+        maior = queda_necessaria(meio) > p["queda"]
+        baixo = np.where(maior, meio, baixo)
+        alto = np.where(maior, alto, meio)
+    h = (baixo + alto) / 2
+    return {"h": h, "b": p["aspecto"] * h}
+
+
+@ponto_operacao("8.95")
+def _8_95_operacao(p):
+    h = _8_95(p)["h"]
+    area = p["aspecto"] * h ** 2
+    d_h = 4 * area / (2 * (p["aspecto"] * h + h))
+    return p["q"] / area * d_h / p["nu"], p["rugosidade"] / d_h
+
+
+@solucionador("8.100", z_a=15.0, l1=80.0, l2=40.0, l3=75.0, d=0.1, f=0.02)
+def _8_100(p):
+    r = np.sqrt(p["l3"] / p["l2"])  # V2 = r V3
+    coeficiente = p["f"] / (p["d"] * 2 * G) * (p["l1"] * (1 + r) ** 2 + p["l2"] * r ** 2)
+    v3 = np.sqrt(p["z_a"] / coeficiente)
+    return area_circular(p["d"]) * r * v3
+
+
+@solucionador("8.109", d_bocal=0.0635, d=0.0965, h_agua=0.945, c_n=0.99)
+def _8_109(p):
+    beta = p["d_bocal"] / p["d"]
+    return p["c_n"] * area_circular(p["d_bocal"]) * np.sqrt(2 * G * p["h_agua"] / (1 - beta ** 4))
+
+
+@solucionador("8.112", q=2.8e-3, d_orificio=0.0305, d=0.051, c_o=0.615)
+def _8_112(p):
+    beta = p["d_orificio"] / p["d"]
+    return p["q"] ** 2 * (1 - beta ** 4) / (2 * G * (p["c_o"] * area_circular(p["d_orificio"])) ** 2)
@@ -0,0 +1,64 @@
+"""
+Tabelas de propriedades exibidas nos resumos dos capítulos.
+"""
+
+TABELAS = {
+    "1.5": {
+        "titulo": "Tabela 1.5 - Propriedades Físicas de Alguns Líquidos",
+        "dados": {
+            "Líquido": ["Tetracloreto de Carbono", "Álcool Etílico", "Gasolina", "Glicerina", "Mercúrio", "Óleo SAE 30", "Água do mar", "Água"],
+            "Temperatura (°C)": [20, 20, 15.6, 20, 20, 15.6, 15.6, 15.6],
+            "Massa Específica (kg/m³)": [1590, 789, 680, 1260, 13600, 912, 1030, 999],
+            "Viscosidade Dinâmica μ (N·s/m²)": [9.58E-4, 1.19E-3, 3.1E-4, 1.50E-1, 1.57E-3, 3.8E-1, 1.2E-3, 1.12E-3],
+            "Tensão Superficial σ (N/m)": [2.69E-2, 2.28E-2, 2.02E-2, 6.33E-2, 4.66E-1, 3.6E-2, 7.34E-2, 7.34E-2],
+            "Pressão de Vapor p_v (N/m² abs)": [1.3E+4, 5.9E+3, 5.5E+4, 1.4E+2, 1.6E+2, 1.5E+2, 1.77E+3, 1.77E+3],
+            "Compressibilidade E_s (N/m²)": [1.31E+9, 1.06E+9, 8.2E+8, 4.52E+9, 2.85E+10, 1.5E+9, 2.34E+9, 2.15E+9]
+        }
+    },
+    "1.6": {
+        "titulo": "Tabela 1.6 - Propriedades Físicas de Alguns Gases",
+        "dados": {
+            "Gás": ["Ar (padrão)", "Dióxido de Carbono", "Hélio", "Hidrogênio", "Metano (gás natural)", "Nitrogênio", "Oxigênio"],
+            "Temperatura (°C)": [15, 20, 20, 20, 0, 20, 20],
+            "Massa Específica (kg/m³)": [1.23E+0, 1.83E+0, 1.66E-1, 8.38E-2, 7.16E-1, 1.16E+0, 1.33E+0],
+            "Viscosidade Dinâmica μ (N·s/m²)": [1.79E-5, 1.47E-5, 1.96E-5, 8.84E-6, 1.10E-5, 1.76E-5, 2.04E-5],
+            "Constante do Gás R (J/kg·K)": [2.869E+2, 1.889E+2, 2.077E+3, 4.124E+3, 5.183E+2, 2.968E+2, 2.598E+2],
+            "Razão de Calores Específicos k": [1.40, 1.30, 1.66, 1.41, 1.31, 1.40, 1.40]
+        }
+    },
+    "8.2": {
+        "titulo": "Tabela 8.2 - Coeficientes de Perda Localizada",
+        "dados": {
+            "Componente": [
+                "Entrada reentrante", "Entrada em aresta viva", "Entrada levemente arredondada", "Entrada bem arredondada",
+                "Saída", "Contração brusca (A₂/A₁ → 0)",
+                "Cotovelo 90° flangeado, raio normal", "Cotovelo 90° rosqueado, raio normal",
+                "Cotovelo 90° flangeado, raio longo", "Cotovelo 90° rosqueado, raio longo",
+                "Cotovelo 45° flangeado, raio longo", "Cotovelo 45° rosqueado, raio normal",
+                "Curva 180° flangeada", "Curva 180° rosqueada",
+                "Tê flangeado, escoamento direto", "Tê rosqueado, escoamento direto",
+                "Tê flangeado, escoamento pelo ramal", "Tê rosqueado, escoamento pelo ramal",
+                "União rosqueada",
+                "Válvula globo, aberta", "Válvula angular, aberta",
+                "Válvula gaveta, aberta", "Válvula gaveta, 1/4 fechada", "Válvula gaveta, 1/2 fechada", "Válvula gaveta, 3/4 fechada",
+                "Válvula de retenção, escoamento direto",
+                "Válvula de esfera, aberta", "Válvula de esfera, 1/3 fechada", "Válvula de esfera, 2/3 fechada"
+            ],
+            "Coeficiente K_L": [
+                0.8, 0.5, 0.2, 0.04,
+                1.0, 0.5,
+                0.3, 1.5,
+                0.2, 0.7,
+                0.2, 0.4,
+                0.2, 1.5,
+                0.2, 0.9,
+                1.0, 2.0,
+                0.08,
+                10.0, 2.0,
+                0.15, 0.26, 2.1, 17.0,
+                2.0,
+                0.05, 5.5, 210.0
+            ]
+        }
+    }
+}
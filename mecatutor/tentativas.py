@@ -0,0 +1,160 @@
+"""
+Registro persistente das tentativas de resposta em SQLite.
+
+Cada correção feita no app vira uma linha (sessão, questão, subitem, texto
+digitado, valor lido, veredito, latência da correção e, para variantes, a
+semente que gerou os parâmetros; NULL na questão do livro). A gravação fica
+em uma thread própria, alimentada por uma fila limitada: `registrar` só
+enfileira com `put_nowait` e, se a fila estiver cheia (uma turma inteira
+respondendo ao mesmo tempo), descarta a tentativa e conta o descarte em
+vez de travar o rerun. A thread grava em lotes, com o banco em modo WAL.
+
+Ativado pela variável de ambiente MECATUTOR_TENTATIVAS com o caminho do
+arquivo .sqlite; vazia, o registro fica desativado.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+CAPACIDADE_FILA = 10_000
+TAMANHO_LOTE = 500
+INTERVALO_GRAVACAO = 1.0
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS tentativas (
+    id          INTEGER PRIMARY KEY,
+    instante    REAL NOT NULL,
+    sessao      TEXT NOT NULL,
+    questao     TEXT NOT NULL,
+    subitem     TEXT NOT NULL DEFAULT '',
+    entrada     TEXT NOT NULL,
+    valor,
+    codigo      INTEGER NOT NULL,
+    latencia_ms REAL NOT NULL,
+    semente     INTEGER
+);
+CREATE INDEX IF NOT EXISTS tentativas_questao ON tentativas (questao, subitem);
+"""
+
+_INSERIR = (
+    "INSERT INTO tentativas (instante, sessao, questao, subitem, entrada, valor, codigo, latencia_ms, semente) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_FIM = object()
+
+
+class RegistroTentativas:
+    """
+    Fila limitada + thread gravadora. Com `caminho=None` fica desativado e
+    `registrar` não faz nada.
+    """
+
+    def __init__(
+        self,
+        caminho: str | None,
+        capacidade: int = CAPACIDADE_FILA,
+        tamanho_lote: int = TAMANHO_LOTE,
+        intervalo: float = INTERVALO_GRAVACAO,
+    ):
+        self.caminho = caminho
+        self.ativo = caminho is not None
+        self.gravadas = 0
+        self.descartadas = 0
+        self._fila: queue.Queue = queue.Queue(maxsize=capacidade)
+        self._tamanho_lote = tamanho_lote
+        self._intervalo = intervalo
+        self._thread: threading.Thread | None = None
+        if self.ativo:
+            # O esquema é criado aqui para que erros de caminho apareçam já na abertura
+            with sqlite3.connect(caminho) as conexao:
+                conexao.execute("PRAGMA journal_mode=WAL")
+                conexao.executescript(ESQUEMA)
+                # Bancos criados antes da coluna semente
+                colunas = {linha[1] for linha in conexao.execute("PRAGMA table_info(tentativas)")}
+                if "semente" not in colunas:
+                    conexao.execute("ALTER TABLE tentativas ADD COLUMN semente INTEGER")
+            conexao.close()
+            self._thread = threading.Thread(target=self._gravar, name="mecatutor-tentativas", daemon=True)
+            self._thread.start()
+
+    def registrar(
+        self,
+        sessao: str,
+        questao: str,
+        subitem: str | None,
+        entrada: str,
+        valor: float | str | None,
+        codigo: int,
+        latencia_ms: float,
+        semente: int | None = None,
+    ) -> bool:
+        """
+        Enfileira uma tentativa sem bloquear. `semente` identifica a variante
+        respondida (None para a questão do livro). Retorna False se ela foi
+        descartada por falta de espaço na fila.
+        """
+        if not self.ativo:
+            return False
+        try:
+            self._fila.put_nowait((time.time(), sessao, questao, subitem or "", entrada, valor, codigo, latencia_ms, semente))
+        except queue.Full:
+            self.descartadas += 1
+            return False
+        return True
+
+    @property
+    def pendentes(self) -> int:
+        return self._fila.qsize()
+
+    def _gravar(self) -> None:
+        conexao = sqlite3.connect(self.caminho)
+        conexao.execute("PRAGMA journal_mode=WAL")
+        conexao.execute("PRAGMA synchronous=NORMAL")
+        terminar = False
+        while not terminar:
+            lote = []
+            item = self._fila.get()
+            prazo = time.monotonic() + self._intervalo
+            while True:
+                if item is _FIM:
+                    terminar = True
+                    break
+                lote.append(item)
+                if len(lote) >= self._tamanho_lote:
+                    break
+                try:
+                    item = self._fila.get(timeout=max(prazo - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+            if lote:
+                with conexao:
+                    conexao.executemany(_INSERIR, lote)
+                self.gravadas += len(lote)
+        conexao.close()
+
+    def fechar(self, espera: float | None = 5.0) -> None:
+        """
+        Grava o que ainda estiver na fila e encerra a thread.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._fila.put(_FIM)
+        self._thread.join(espera)
+
+
+def configurar(caminho: str | None = None) -> RegistroTentativas:
+    """
+    Cria o registro conforme MECATUTOR_TENTATIVAS (ou `caminho`).
+    """
+    if caminho is None:
+        caminho = os.environ.get("MECATUTOR_TENTATIVAS", "").strip()
+    registro = RegistroTentativas(caminho or None)
+    if registro.ativo:
+        atexit.register(registro.fechar)
+    return registro
@@ -0,0 +1,156 @@
+"""
+Escoamento em um tubo: os três problemas clássicos com Darcy-Weisbach.
+
+    perda_carga   tipo I: dados Q e D, calcula h_L
+    vazao         tipo II: dados h_L e D, calcula Q
+    diametro      tipo III: dados Q e h_L, calcula D
+
+com h_L = (f L/D + ΣK) V²/(2g) e f de `atrito.fator_atrito_continuo`
+(Colebrook, sem salto na zona de transição). Este módulo também define
+as constantes e a área usadas pelos demais cálculos de tubulação
+(`solucionadores`, `redes`, `perdas_localizadas`).
+Os tipos II e III invertem h_L, que é monótona na incógnita: a raiz é
+cercada num intervalo amplo e refinada pelo método de Illinois (falsa
+posição modificada) em log-log, onde a curva é quase reta (inclinação
+entre 1 no laminar e 2 no totalmente rugoso); na prática converge em
+poucas iterações e nunca sai do intervalo. Sem raiz no intervalo o
+resultado é nan.
+
+Com argumentos escalares o resultado é memorizado pelas entradas
+arredondadas a ALGARISMOS_CACHE algarismos significativos; com arrays
+todos os casos são resolvidos de uma vez (sem cache), com broadcasting.
+
+    >>> round(perda_carga(0.01, 0.1, 100, rugosidade=4.5e-5), 3)
+    1.611
+    >>> round(vazao(1.611, 0.1, 100, rugosidade=4.5e-5), 5)
+    0.01
+    >>> diametro(np.array([0.01, 0.02]), 1.611, 100, rugosidade=4.5e-5).round(4)
+    array([0.1   , 0.1299])
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+from mecatutor.atrito import fator_atrito_continuo
+
+G = 9.81  # m/s²
+NU_AGUA = 1.0e-6  # m²/s, água a 20 °C
+TOLERANCIA = 1e-10
+MAX_ITERACOES = 100
+ALGARISMOS_CACHE = 6
+TAMANHO_CACHE = 4096
+
+# Intervalos em que a raiz é procurada
+VELOCIDADE_MIN, VELOCIDADE_MAX = 1e-6, 1e3  # m/s
+DIAMETRO_MIN, DIAMETRO_MAX = 1e-5, 1e2  # m
+
+
+def _escalares(*valores) -> bool:
+    return all(isinstance(valor, (int, float)) or np.ndim(valor) == 0 for valor in valores)
+
+
+def _arredondar(valor) -> float:
+    return float(f"{float(valor):.{ALGARISMOS_CACHE}g}")
+
+
+def area_circular(diametro):
+    return np.pi * diametro ** 2 / 4
+
+
+def _perda_carga(q, d, l, rugosidade, nu, soma_k):
+    v = q / area_circular(d)
+    f = fator_atrito_continuo(np.abs(v) * d / nu, rugosidade / d)
+    return (f * l / d + soma_k) * v * np.abs(v) / (2 * G)
+
+
+def inverter(residuo, baixo, alto, tolerancia: float = TOLERANCIA, max_iteracoes: int = MAX_ITERACOES):
+    """
+    Raiz de `residuo` (crescente) em [baixo, alto] > 0, elemento a elemento,
+    pelo método de Illinois em ln x. nan onde o intervalo não cerca a raiz.
+    """
+    a, b = np.log(baixo), np.log(alto)
+    fa, fb = residuo(np.exp(a)), residuo(np.exp(b))
+    cercada = (fa <= 0) & (fb >= 0)
+    for _ in range(max_iteracoes):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c = np.where(fb != fa, b - fb * (b - a) / (fb - fa), b)
+        fc = residuo(np.exp(c))
+        mesmo_sinal = np.sign(fc) == np.sign(fb)
+        # Illinois: o extremo que fica parado tem o resíduo dividido por 2
+        a, fa = np.where(mesmo_sinal, a, b), np.where(mesmo_sinal, fa / 2, fb)
+        b, fb = c, fc
+        if not np.any(cercada & (np.abs(fc) > tolerancia)):
+            break
+    return np.where(cercada, np.exp(b), np.nan)
+
+
+def _vazao(h_l, d, l, rugosidade, nu, soma_k):
+    h_l, d, l, rugosidade, nu, soma_k = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (h_l, d, l, rugosidade, nu, soma_k)))
+    area = area_circular(d)
+    return inverter(
+        lambda q: np.log(_perda_carga(q, d, l, rugosidade, nu, soma_k) / h_l),
+        VELOCIDADE_MIN * area, VELOCIDADE_MAX * area,
+    )
+
+
+def _diametro(q, h_l, l, rugosidade, nu, soma_k):
+    q, h_l, l, rugosidade, nu, soma_k = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (q, h_l, l, rugosidade, nu, soma_k)))
+    return inverter(
+        lambda d: np.log(h_l / _perda_carga(q, d, l, rugosidade, nu, soma_k)),
+        np.full(q.shape, DIAMETRO_MIN), np.full(q.shape, DIAMETRO_MAX),
+    )
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def _perda_carga_memorizada(*entradas: float) -> float:
+    return float(_perda_carga(*entradas))
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def _vazao_memorizada(*entradas: float) -> float:
+    return float(_vazao(*entradas))
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def _diametro_memorizado(*entradas: float) -> float:
+    return float(_diametro(*entradas))
+
+
+def perda_carga(q, d, l, rugosidade=0.0, nu=NU_AGUA, soma_k=0.0):
+    """
+    h_L (m) para vazão `q` (m³/s) num tubo de diâmetro `d` e comprimento
+    `l` (m), rugosidade absoluta `rugosidade` (m) e perdas localizadas ΣK.
+    Com `q` negativo h_L também é negativo (a perda se opõe ao escoamento).
+    """
+    entradas = (q, d, l, rugosidade, nu, soma_k)
+    if _escalares(*entradas):
+        return _perda_carga_memorizada(*map(_arredondar, entradas))
+    return _perda_carga(*entradas)
+
+
+def vazao(h_l, d, l, rugosidade=0.0, nu=NU_AGUA, soma_k=0.0):
+    """
+    Q (m³/s) que produz a perda de carga `h_l` (m).
+    """
+    entradas = (h_l, d, l, rugosidade, nu, soma_k)
+    if _escalares(*entradas):
+        return _vazao_memorizada(*map(_arredondar, entradas))
+    return _vazao(*entradas)
+
+
+def diametro(q, h_l, l, rugosidade=0.0, nu=NU_AGUA, soma_k=0.0):
+    """
+    D (m) que conduz a vazão `q` com perda de carga `h_l`.
+    """
+    entradas = (q, h_l, l, rugosidade, nu, soma_k)
+    if _escalares(*entradas):
+        return _diametro_memorizado(*map(_arredondar, entradas))
+    return _diametro(*entradas)
+
+
+def limpar_cache() -> None:
+    for funcao in (_perda_carga_memorizada, _vazao_memorizada, _diametro_memorizado):
+        funcao.cache_clear()
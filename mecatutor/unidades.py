@@ -0,0 +1,201 @@
+"""
+Leitura das respostas digitadas: número em formato brasileiro ou
+internacional, com unidade opcional convertida para a unidade da questão.
+
+    >>> ler_resposta("32,22 kPa", "kPa")
+    32.22
+    >>> ler_resposta("3,2e4 Pa", "kPa")
+    32.0
+    >>> ler_resposta("1.234,5", "m")
+    1234.5
+    >>> ler_resposta("15 L/s", "m³/s")
+    0.015
+
+Uma vírgula ou um ponto isolados são sempre separador decimal ("1,234" e
+"1.234" valem 1,234); separadores de milhar só são reconhecidos em grupos de
+três dígitos acompanhados do outro separador ou repetidos ("1.234,5",
+"1,234.5", "1.234.567").
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from functools import lru_cache
+
+# Unidade -> (grandeza, fator para a unidade de referência da grandeza)
+UNIDADES = {
+    # comprimento
+    "m": ("comprimento", 1.0),
+    "cm": ("comprimento", 1e-2),
+    "mm": ("comprimento", 1e-3),
+    "km": ("comprimento", 1e3),
+    "ft": ("comprimento", 0.3048),
+    "in": ("comprimento", 0.0254),
+    # velocidade
+    "m/s": ("velocidade", 1.0),
+    "cm/s": ("velocidade", 1e-2),
+    "km/h": ("velocidade", 1 / 3.6),
+    "ft/s": ("velocidade", 0.3048),
+    # vazão
+    "m3/s": ("vazao", 1.0),
+    "m3/h": ("vazao", 1 / 3600),
+    "L/s": ("vazao", 1e-3),
+    "L/min": ("vazao", 1e-3 / 60),
+    "ft3/s": ("vazao", 0.3048 ** 3),
+    # pressão
+    "Pa": ("pressao", 1.0),
+    "N/m2": ("pressao", 1.0),
+    "kPa": ("pressao", 1e3),
+    "kN/m2": ("pressao", 1e3),
+    "MPa": ("pressao", 1e6),
+    "bar": ("pressao", 1e5),
+    "atm": ("pressao", 101325.0),
+    "mmHg": ("pressao", 133.322),
+    "mca": ("pressao", 9806.65),
+    "psi": ("pressao", 6894.757),
+    # força
+    "N": ("forca", 1.0),
+    "kN": ("forca", 1e3),
+    "kgf": ("forca", 9.80665),
+    "lbf": ("forca", 4.448222),
+    # peso específico
+    "N/m3": ("peso_especifico", 1.0),
+    "kN/m3": ("peso_especifico", 1e3),
+    # ângulo
+    "graus": ("angulo", 1.0),
+    "rad": ("angulo", 180 / math.pi),
+    # sem dimensão
+    "adimensional": ("adimensional", 1.0),
+}
+
+# Grafias alternativas -> nome em UNIDADES
+SINONIMOS = {
+    "l/s": "L/s",
+    "l/min": "L/min",
+    "°": "graus",
+    "grau": "graus",
+    "deg": "graus",
+    "mH2O": "mca",
+    "m.c.a.": "mca",
+}
+
+# Tabela pré-calculada: (origem, destino) -> fator multiplicativo
+CONVERSOES = {
+    (origem, destino): fator_origem / fator_destino
+    for origem, (grandeza_origem, fator_origem) in UNIDADES.items()
+    for destino, (grandeza_destino, fator_destino) in UNIDADES.items()
+    if grandeza_origem == grandeza_destino
+}
+
+
+def _sem_caixa() -> dict[str, str]:
+    """
+    Nome em minúsculas -> nome correto ("kpa" -> "kPa"), só para os que
+    não ficam ambíguos.
+    """
+    nomes: dict[str, list[str]] = {}
+    for nome in (*UNIDADES, *SINONIMOS):
+        nomes.setdefault(nome.lower(), []).append(nome)
+    return {minusculo: opcoes[0] for minusculo, opcoes in nomes.items() if len(opcoes) == 1}
+
+
+_SEM_CAIXA = _sem_caixa()
+
+_SOBRESCRITOS = str.maketrans({"²": "2", "³": "3", "⁻": "-", "¹": "1", "−": "-", "·": "*", "⋅": "*"})
+
+_RESPOSTA = re.compile(
+    r"""\s*(?P<sinal>[+-]?)\s*
+        (?P<mantissa>\d[\d.,]*|[.,]\d+)
+        (?:\s*[eE](?P<expoente>[+-]?\d+)|\s*[x×*]\s*10\s*\^\s*(?P<potencia>[+-]?\d+))?
+        \s*(?P<unidade>.*?)\s*$""",
+    re.VERBOSE,
+)
+_DECIMAL = re.compile(r"\d+(?:[.,]\d*)?|[.,]\d+")
+_MILHAR_BR = re.compile(r"\d{1,3}(?:\.\d{3})+(?:,\d*)?")
+_MILHAR_INT = re.compile(r"\d{1,3}(?:,\d{3})+\.\d*|\d{1,3}(?:,\d{3}){2,}")
+
+
+def normalizar_unidade(unidade: str) -> str:
+    """
+    Forma canônica de uma unidade ("m³/s" -> "m3/s", "kpa" -> "kPa"). Unidades
+    desconhecidas voltam só sem espaços.
+    """
+    texto = unidade.translate(_SOBRESCRITOS).replace(" ", "").replace("^", "")
+    if texto not in UNIDADES and texto not in SINONIMOS:
+        texto = _SEM_CAIXA.get(texto.lower(), texto)
+    return SINONIMOS.get(texto, texto)
+
+
+def _mantissa(texto: str) -> float:
+    if _DECIMAL.fullmatch(texto):
+        return float(texto.replace(",", "."))
+    if _MILHAR_BR.fullmatch(texto):
+        return float(texto.replace(".", "").replace(",", "."))
+    if _MILHAR_INT.fullmatch(texto):
+        return float(texto.replace(",", ""))
+    raise ValueError(f"Número inválido: {texto!r}")
+
+
+def ler_valor(texto: str) -> tuple[float, str]:
+    """
+    Separa a resposta em (número, unidade digitada). A unidade vem
+    normalizada, ou vazia se não foi digitada. Levanta ValueError se o texto
+    não começar por um número ou se o número não couber num float.
+    """
+    correspondencia = _RESPOSTA.fullmatch(texto.translate(_SOBRESCRITOS))
+    if correspondencia is None:
+        raise ValueError(f"Número inválido: {texto!r}")
+    valor = _mantissa(correspondencia["mantissa"])
+    expoente = correspondencia["expoente"] or correspondencia["potencia"]
+    if expoente:
+        try:
+            valor *= 10.0 ** int(expoente)
+        except OverflowError:
+            raise ValueError(f"Número fora do intervalo: {texto!r}") from None
+    if not math.isfinite(valor):
+        raise ValueError(f"Número fora do intervalo: {texto!r}")
+    if correspondencia["sinal"] == "-":
+        valor = -valor
+    unidade = correspondencia["unidade"]
+    return valor, normalizar_unidade(unidade) if unidade else ""
+
+
+def unidade_principal(unidade: str) -> str:
+    """
+    Unidade de uma questão cujo texto tem explicação depois da unidade
+    ("m para a diferença da comparação" -> "m").
+    """
+    normalizada = normalizar_unidade(unidade)
+    if normalizada not in UNIDADES and unidade.strip():
+        primeira = normalizar_unidade(unidade.split()[0])
+        if primeira in UNIDADES:
+            return primeira
+    return normalizada
+
+
+@lru_cache(maxsize=8192)
+def fator(origem: str, destino: str) -> float:
+    """
+    Fator de conversão entre duas unidades (já normalizadas ou não).
+    Levanta ValueError se forem de grandezas diferentes ou desconhecidas.
+    """
+    origem, destino = normalizar_unidade(origem), unidade_principal(destino)
+    if origem == destino:
+        return 1.0
+    try:
+        return CONVERSOES[origem, destino]
+    except KeyError:
+        raise ValueError(f"Não é possível converter {origem!r} para {destino!r}") from None
+
+
+@lru_cache(maxsize=65536)
+def ler_resposta(texto: str, unidade: str = "") -> float:
+    """
+    Valor numérico da resposta na `unidade` da questão. Sem unidade
+    digitada, o número é tomado como já estando nessa unidade.
+    """
+    valor, digitada = ler_valor(texto)
+    if not digitada:
+        return valor
+    return valor * fator(digitada, unidade)
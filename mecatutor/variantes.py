@@ -0,0 +1,213 @@
+"""
+Variantes parametrizadas das questões.
+
+Um modelo (`@modelo` em MODELOS) diz quais dados do enunciado podem ser
+sorteados, em que faixa e com quantas casas. Cada faixa aponta o trecho
+literal do enunciado que contém o número ("13,8 kPa"); só esse número é
+trocado. A resposta e a tolerância de cada variante vêm do solucionador
+da questão (`mecatutor.solucionadores`), chamado uma única vez para todas
+as sementes de um lote.
+
+O sorteio é determinístico por (questão, dado, semente): um SplitMix64
+vetorizado sobre o array de sementes, então a mesma semente gera sempre
+a mesma variante, esteja sozinha ou num lote de milhares.
+
+    >>> from mecatutor.conteudo import Conteudo
+    >>> catalogo = CatalogoVariantes(Conteudo.abrir().banco())
+    >>> lote = catalogo.gerar("2.27", np.arange(10_000))
+    >>> lote.respostas[None].shape
+    (10000,)
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+import numpy as np
+
+from mecatutor.banco import BancoQuestoes, Questao
+from mecatutor.solucionadores import SOLUCIONADORES
+
+# Variantes (questão, semente) mantidas em memória, compartilhadas entre sessões
+CAPACIDADE_CACHE = 50_000
+
+AVISO_RESOLUCAO = (
+    "> ℹ️ Os dados deste enunciado foram sorteados para você. A resolução "
+    "abaixo usa os dados originais do livro: siga os mesmos passos com os seus valores.\n\n"
+)
+
+_NUMERO = re.compile(r"\d+(?:[.,]\d+)*")
+
+
+@dataclass(frozen=True)
+class Faixa:
+    """
+    Dado sorteado de uma questão. `minimo`, `maximo` e `casas` estão na
+    unidade do enunciado; o solucionador recebe o valor vezes `escala`.
+    """
+    parametro: str
+    trecho: str
+    minimo: float
+    maximo: float
+    casas: int = 0
+    escala: float = 1.0
+
+    def formatar(self, valor: float) -> str:
+        casas = max(self.casas, 0)
+        numero = f"{valor:,.{casas}f}".replace(",", "_").replace(".", ",").replace("_", ".")
+        return _NUMERO.sub(numero, self.trecho, count=1)
+
+
+MODELOS: dict[str, tuple[Faixa, ...]] = {}
+
+
+def modelo(questao_id: str, *faixas: Faixa) -> None:
+    MODELOS[questao_id] = faixas
+
+
+modelo("2.27", Faixa("p_ar", "13,8 kPa", 8.0, 20.0, 1, 1e3))
+modelo("2.32", Faixa("p_a_psi", "0,6 psi", 0.5, 1.2, 1), Faixa("sg_m", "densidade 2,6", 2.0, 3.0, 1))
+modelo("2.35", Faixa("rho", "800 kg/m³", 600, 1000, -1), Faixa("p_vapor", "120 kPa (abs)", 105, 150, 0, 1e3))
+modelo("2.41", Faixa("d_pistao", "diâmetro = 152 mm", 100, 250, 0, 1e-3))
+modelo("2.44", Faixa("delta_p", "0,7 kPa", 0.5, 1.0, 2, 1e3))
+modelo("2.46", Faixa("delta_p", "34,5 kPa", 20.0, 50.0, 1, 1e3))
+modelo("3.14", Faixa("v_terreo", "6,1 m/s", 4.0, 12.0, 1), Faixa("andar", "3,6 m", 2.8, 4.0, 1))
+modelo("3.19", Faixa("d", "é 19 mm", 12, 30, 0, 1e-3), Faixa("h", "71 mm", 40, 150, 0, 1e-3))
+modelo("3.43", Faixa("d", "15 mm", 10, 25, 0, 1e-3))
+modelo("3.51", Faixa("largura", "igual a 0,06 m", 0.04, 0.12, 2))
+modelo("3.68", Faixa("v2", r"4,6\,\mathrm{m/s}", 4.0, 6.0, 1))
+modelo("8.71", Faixa("q", r"5,68 \times 10^{-5}", 3.0, 9.0, 2, 1e-5))
+modelo("8.73", Faixa("p1", "13,8 bar", 10.0, 20.0, 1, 1e5), Faixa("f", "igual a 0,022", 0.018, 0.030, 3))
+modelo("8.83", Faixa("q", r"1,42 \times 10^{-2}", 0.8, 2.5, 2, 1e-2))
+modelo("8.86", Faixa("rugosidade_relativa", "é 0,004", 0.001, 0.010, 3))
+modelo("8.95", Faixa("q", "6 litros/s", 3, 10, 0, 1e-3))
+modelo("8.109", Faixa("h_agua", "945 mm", 500, 1500, 0, 1e-3))
+modelo("8.112", Faixa("q", "2,8 litros/s", 1.5, 4.0, 1, 1e-3), Faixa("d_orificio", "30,5 mm", 25.0, 38.0, 1, 1e-3))
+
+
+def _misturar(x: np.ndarray) -> np.ndarray:
+    # SplitMix64 (Steele, Lea e Flood); o estouro em uint64 é a aritmética mod 2⁶⁴ desejada
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def uniformes(sementes: np.ndarray, fluxo: str) -> np.ndarray:
+    """
+    Um número em [0, 1) por semente, independente para cada `fluxo`.
+    """
+    chave = _misturar(np.array([zlib.crc32(fluxo.encode())], dtype=np.uint64))
+    bits = _misturar(np.asarray(sementes, dtype=np.uint64) ^ chave)
+    return (bits >> np.uint64(11)).astype(np.float64) * 2.0 ** -53
+
+
+@dataclass(frozen=True)
+class LoteVariantes:
+    """
+    Variantes de uma questão para um array de sementes. `respostas` e
+    `tolerancias` são indexadas pelo subitem (None para resposta única).
+    """
+    questao: str
+    sementes: np.ndarray
+    exibidos: Mapping[str, np.ndarray]
+    respostas: Mapping[str | None, np.ndarray]
+    tolerancias: Mapping[str | None, np.ndarray]
+
+
+class CatalogoVariantes:
+    """
+    Gera variantes em lote e guarda cada `Questao` derivada por
+    (questão, semente), compartilhada entre as sessões.
+    """
+
+    def __init__(self, banco: BancoQuestoes, capacidade: int = CAPACIDADE_CACHE):
+        self.banco = banco
+        self.capacidade = capacidade
+        self._cache: OrderedDict[tuple[str, int], Questao] = OrderedDict()
+        self._trava = threading.Lock()
+
+    def tem_modelo(self, questao_id: str) -> bool:
+        return questao_id in MODELOS and questao_id in SOLUCIONADORES
+
+    def gerar(self, questao_id: str, sementes: Iterable[int]) -> LoteVariantes:
+        """
+        Sorteia os dados e resolve todas as sementes com uma chamada ao
+        solucionador. A tolerância cadastrada é escalada com a resposta.
+        """
+        questao = self.banco[questao_id]
+        sementes = np.atleast_1d(np.asarray(sementes, dtype=np.uint64))
+        exibidos, parametros = {}, {}
+        for faixa in MODELOS[questao_id]:
+            sorteio = faixa.minimo + uniformes(sementes, f"{questao_id}/{faixa.parametro}") * (faixa.maximo - faixa.minimo)
+            exibidos[faixa.parametro] = np.round(sorteio, faixa.casas)
+            parametros[faixa.parametro] = exibidos[faixa.parametro] * faixa.escala
+
+        calculado = SOLUCIONADORES[questao_id].resolver(parametros)
+        respostas, tolerancias = {}, {}
+        for subitem in questao.subitens or (None,):
+            valor = np.broadcast_to(calculado[subitem] if subitem is not None else calculado, sementes.shape)
+            original = float(questao.resposta_de(subitem))
+            tolerancia = questao.tolerancia_de(subitem)
+            respostas[subitem] = valor
+            tolerancias[subitem] = tolerancia * np.abs(valor / original) if original else np.full(sementes.shape, float(tolerancia))
+        return LoteVariantes(questao_id, sementes, exibidos, respostas, tolerancias)
+
+    def preparar(self, questao_id: str, sementes: Iterable[int]) -> None:
+        """
+        Gera de uma vez as variantes de várias sementes (uma turma inteira)
+        e deixa todas no cache.
+        """
+        lote = self.gerar(questao_id, sementes)
+        for indice, semente in enumerate(lote.sementes.tolist()):
+            self._guardar((questao_id, semente), montar(self.banco[questao_id], lote, indice))
+
+    def questao(self, questao: Questao, semente: int) -> Questao:
+        """
+        A variante de `questao` para `semente`; a própria questão se ela
+        não tiver modelo.
+        """
+        if not self.tem_modelo(questao.id):
+            return questao
+        chave = (questao.id, int(semente))
+        with self._trava:
+            variante = self._cache.get(chave)
+            if variante is not None:
+                self._cache.move_to_end(chave)
+                return variante
+        return self._guardar(chave, montar(questao, self.gerar(questao.id, [semente]), 0))
+
+    def _guardar(self, chave: tuple[str, int], variante: Questao) -> Questao:
+        with self._trava:
+            variante = self._cache.setdefault(chave, variante)
+            if len(self._cache) > self.capacidade:
+                self._cache.popitem(last=False)
+        return variante
+
+
+def montar(questao: Questao, lote: LoteVariantes, indice: int) -> Questao:
+    """
+    A `Questao` da variante `indice` do lote: enunciado com os dados
+    sorteados, resposta e tolerância da variante.
+    """
+    enunciado = questao.enunciado
+    for faixa in MODELOS[lote.questao]:
+        enunciado = enunciado.replace(faixa.trecho, faixa.formatar(lote.exibidos[faixa.parametro][indice]), 1)
+
+    if questao.tem_subitens:
+        resposta = MappingProxyType({subitem: float(valores[indice]) for subitem, valores in lote.respostas.items()})
+        tolerancia = MappingProxyType({subitem: float(valores[indice]) for subitem, valores in lote.tolerancias.items()})
+    else:
+        resposta = float(lote.respostas[None][indice])
+        tolerancia = float(lote.tolerancias[None][indice])
+    # Os erros cadastrados valem para os números do livro; os genéricos são recalculados
+    return replace(
+        questao, enunciado=enunciado, resolucao=AVISO_RESOLUCAO + questao.resolucao,
+        resposta=resposta, tolerancia=tolerancia, erros_comuns=(),
+    )
@@ -0,0 +1,121 @@
+"""
+Verificação do gabarito contra os solucionadores executáveis.
+
+Roda o solucionador de cada questão (em paralelo, um processo por núcleo),
+compara com `resposta`/`tolerancia` do banco e mede o custo de cada um:
+
+    ok                  o valor calculado está dentro da tolerância
+    DIVERGENTE          o valor calculado está fora da tolerância
+    TOLERÂNCIA LARGA    a tolerância passa de LIMITE_FOLGA do valor calculado
+    sem solucionador    questão numérica ainda sem função em `solucionadores`
+
+    python -m mecatutor.verificacao [--processos N] [--repeticoes N] [--lote N]
+
+Sai com código 1 se houver divergências.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Tolerância relativa acima da qual o gabarito aceitaria respostas erradas
+LIMITE_FOLGA = 0.10
+
+_banco = None
+
+
+def _iniciar_processo() -> None:
+    global _banco
+    from mecatutor.conteudo import Conteudo
+    _banco = Conteudo.abrir().banco()
+
+
+def _cronometrar(funcao, repeticoes: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes
+
+
+def verificar_questao(questao_id: str, repeticoes: int = 100, lote: int = 10_000) -> list[dict]:
+    """
+    Linhas do relatório de uma questão (uma por subitem). Os tempos são por
+    chamada escalar e por variante em uma chamada com `lote` parâmetros.
+    """
+    import numpy as np
+    from mecatutor.solucionadores import SOLUCIONADORES
+
+    questao = _banco[questao_id]
+    subitens = questao.subitens or (None,)
+    solucionador = SOLUCIONADORES.get(questao_id)
+    if solucionador is None:
+        return [{"questao": questao_id, "subitem": subitem or "", "status": "sem solucionador"} for subitem in subitens]
+
+    calculado = solucionador.resolver()
+    escalar = _cronometrar(solucionador.resolver, repeticoes)
+    variados = {nome: np.full(lote, valor, dtype=np.float64) for nome, valor in solucionador.dados.items()}
+    por_variante = _cronometrar(lambda: solucionador.resolver(variados), max(repeticoes // 10, 1)) / lote
+
+    linhas = []
+    for subitem in subitens:
+        valor = float(calculado[subitem] if subitem is not None else calculado)
+        esperado = float(questao.resposta_de(subitem))
+        tolerancia = float(questao.tolerancia_de(subitem))
+        if abs(valor - esperado) > tolerancia:
+            status = "DIVERGENTE"
+        elif valor and tolerancia > LIMITE_FOLGA * abs(valor):
+            status = "TOLERÂNCIA LARGA"
+        else:
+            status = "ok"
+        linhas.append({
+            "questao": questao_id, "subitem": subitem or "", "status": status,
+            "cadastrado": esperado, "calculado": valor, "tolerancia": tolerancia,
+            "us_chamada": escalar * 1e6, "us_variante": por_variante * 1e6,
+        })
+    return linhas
+
+
+def verificar(processos: int | None = None, repeticoes: int = 100, lote: int = 10_000) -> list[dict]:
+    from mecatutor.conteudo import Conteudo
+    banco = Conteudo.abrir().banco()
+    ids = [questao.id for questao in banco.questoes() if questao.tipo != "texto"]
+    with ProcessPoolExecutor(processos, initializer=_iniciar_processo) as executor:
+        resultados = executor.map(verificar_questao, ids, [repeticoes] * len(ids), [lote] * len(ids))
+        return [linha for linhas in resultados for linha in linhas]
+
+
+def formatar(linhas: list[dict]) -> str:
+    saida = [f"{'questão':<10}{'item':<10}{'cadastrado':>13}{'calculado':>13}{'tolerância':>12}"
+             f"{'µs/chamada':>12}{'µs/variante':>13}  situação"]
+    for linha in linhas:
+        if "calculado" not in linha:
+            saida.append(f"{linha['questao']:<10}{linha['subitem']:<10}{'':>63}  {linha['status']}")
+            continue
+        saida.append(
+            f"{linha['questao']:<10}{linha['subitem']:<10}{linha['cadastrado']:>13.5g}{linha['calculado']:>13.5g}"
+            f"{linha['tolerancia']:>12.3g}{linha['us_chamada']:>12.1f}{linha['us_variante']:>13.3f}  {linha['status']}"
+        )
+    contagem: dict[str, int] = {}
+    for linha in linhas:
+        contagem[linha["status"]] = contagem.get(linha["status"], 0) + 1
+    saida += ["", ", ".join(f"{status}: {total}" for status, total in sorted(contagem.items()))]
+    return "\n".join(saida)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Confere o gabarito com os solucionadores executáveis.")
+    parser.add_argument("--processos", type=int, default=None)
+    parser.add_argument("--repeticoes", type=int, default=100, help="chamadas cronometradas por questão")
+    parser.add_argument("--lote", type=int, default=10_000, help="variantes na medição vetorizada")
+    argumentos = parser.parse_args(argv)
+
+    linhas = verificar(argumentos.processos, argumentos.repeticoes, argumentos.lote)
+    print(formatar(linhas))
+    return 1 if any(linha["status"] == "DIVERGENTE" for linha in linhas) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,15 @@
+"""
+Ponto de entrada do servidor: `streamlit run servidor.py`.
+
+Roda o `app.py` como `st.App`, com `MiddlewareFiguras` na frente do
+Streamlit para que as figuras das questões saiam da memória com cache de
+longa duração (ver `mecatutor.imagens`). `streamlit run app.py` continua
+funcionando, servindo as figuras pela rota estática do Streamlit.
+"""
+
+import streamlit as st
+from starlette.middleware import Middleware
+
+from mecatutor.imagens import MiddlewareFiguras
+
+app = st.App("app.py", middleware=[Middleware(MiddlewareFiguras)])